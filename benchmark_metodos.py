@@ -0,0 +1,193 @@
+"""Microbenchmarks de los núcleos de interpolación de metodos.py.
+
+Se ejecuta sin interfaz gráfica:
+
+    python benchmark_metodos.py --salida resultados.json
+
+Para cada método mide evaluaciones por segundo, percentiles de latencia por
+evaluación y memoria pico, y escribe los resultados en JSON para comparar corridas.
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from metodos import MetodosCalculo, ConjuntoPuntos
+
+NODOS_POR_DEFECTO = [4, 10, 100, 1000]
+EVALUACIONES_POR_DEFECTO = [1, 100, 10000, 100000]
+
+
+def generar_conjunto(n):
+    """Puntos equiespaciados de una función suave (válidos para todos los métodos)"""
+    x = np.linspace(0.0, n - 1.0, n)
+    return ConjuntoPuntos(zip(x, np.sin(x / 3.0)))
+
+
+def kernels_interpolacion(metodos):
+    """Núcleos que evalúan m valores de x; cada uno se describe con su costo aproximado"""
+    def interpolante(metodo):
+        # Se construye el interpolante dentro de la medición: incluye el costo de la tabla
+        return lambda x, conjunto: metodos.crear_interpolante(conjunto, metodo)(x)
+
+    return {
+        # nombre: (función, costo estimado en operaciones elementales para n nodos y m valores)
+        "interpolacion_lagrange": (metodos.interpolacion_lagrange, lambda n, m: n * n * m),
+        "interpolacion_lagrange_baricentrica": (metodos.interpolacion_lagrange_baricentrica, lambda n, m: n * n + n * m),
+        "interpolacion_newton_adelante": (metodos.interpolacion_newton_adelante, lambda n, m: n * n + n * m),
+        "interpolacion_newton_atras": (metodos.interpolacion_newton_atras, lambda n, m: n * n + n * m),
+        "interpolacion_diferencias_divididas": (metodos.interpolacion_diferencias_divididas, lambda n, m: n * n + n * m),
+        "interpolante_newton_adelante": (interpolante("Newton hacia adelante"), lambda n, m: n * n + n * m),
+        "interpolante_newton_atras": (interpolante("Newton hacia atrás"), lambda n, m: n * n + n * m),
+        "interpolante_diferencias_divididas": (interpolante("Newton con diferencias divididas"), lambda n, m: n * n + n * m),
+        "interpolante_lagrange": (interpolante("Lagrange"), lambda n, m: n * n + n * m),
+    }
+
+
+def kernels_tablas(metodos):
+    """Constructores de tablas de diferencias (no dependen del número de evaluaciones)"""
+    return {
+        "calcular_diferencias_finitas": metodos.calcular_diferencias_finitas,
+        "calcular_diferencias_divididas": metodos.calcular_diferencias_divididas,
+    }
+
+
+def medir(funcion, tiempo_minimo, repeticiones_maximas):
+    """Ejecuta funcion repetidamente y devuelve los tiempos (s) de cada repetición"""
+    funcion()  # Calentamiento
+    tiempos = []
+    inicio = time.perf_counter()
+    while len(tiempos) < repeticiones_maximas:
+        t0 = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - t0)
+        if time.perf_counter() - inicio >= tiempo_minimo and len(tiempos) >= 3:
+            break
+    return np.array(tiempos)
+
+
+def memoria_pico(funcion):
+    """Memoria pico (bytes) asignada durante una ejecución de funcion"""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def resumir(nombre, n, m, tiempos, pico):
+    """Arma el registro de resultados para una combinación (kernel, n, m)"""
+    por_llamada = float(np.mean(tiempos))
+    latencias = tiempos / (m or 1)
+    p50, p90, p99 = np.percentile(latencias, [50, 90, 99])
+    return {
+        "kernel": nombre,
+        "nodos": n,
+        "evaluaciones": m,
+        "repeticiones": len(tiempos),
+        "segundos_por_llamada": por_llamada,
+        "operaciones_por_segundo": (m or 1) / por_llamada,
+        "latencia_p50_s": float(p50),
+        "latencia_p90_s": float(p90),
+        "latencia_p99_s": float(p99),
+        "memoria_pico_bytes": pico,
+    }
+
+
+def medir_kernel(nombre, n, m, funcion, tiempo_minimo, repeticiones_maximas):
+    """Mide una combinación; si el kernel falla, lo registra como error en lugar de abortar la corrida"""
+    try:
+        tiempos = medir(funcion, tiempo_minimo, repeticiones_maximas)
+        return resumir(nombre, n, m, tiempos, memoria_pico(funcion))
+    except (ArithmeticError, ValueError, MemoryError) as error:
+        return {"kernel": nombre, "nodos": n, "evaluaciones": m,
+                "error": f"{type(error).__name__}: {error}"}
+
+
+def ejecutar(nodos, evaluaciones, tiempo_minimo, repeticiones_maximas, presupuesto, filtro=None):
+    """Corre todas las combinaciones y devuelve la lista de resultados"""
+    metodos = MetodosCalculo()
+    resultados = []
+
+    with np.errstate(all='ignore'):  # Las tablas con n grande pueden desbordar: solo se mide tiempo
+        for n in nodos:
+            conjunto = generar_conjunto(n)
+
+            for nombre, construir in kernels_tablas(metodos).items():
+                if filtro and filtro not in nombre:
+                    continue
+                funcion = lambda: construir(conjunto)
+                resultados.append(medir_kernel(nombre, n, None, funcion, tiempo_minimo, repeticiones_maximas))
+                imprimir(resultados[-1])
+
+            for m in evaluaciones:
+                x = np.linspace(-1.0, float(n), m)
+                for nombre, (kernel, costo) in kernels_interpolacion(metodos).items():
+                    if filtro and filtro not in nombre:
+                        continue
+                    if costo(n, m) > presupuesto:
+                        resultados.append({"kernel": nombre, "nodos": n, "evaluaciones": m,
+                                           "omitido": "excede el presupuesto de operaciones"})
+                        imprimir(resultados[-1])
+                        continue
+                    funcion = lambda: kernel(x, conjunto)
+                    resultados.append(medir_kernel(nombre, n, m, funcion, tiempo_minimo, repeticiones_maximas))
+                    imprimir(resultados[-1])
+
+    return resultados
+
+
+def imprimir(resultado):
+    """Muestra una línea legible por cada resultado"""
+    etiqueta = f"{resultado['kernel']:<38} n={resultado['nodos']:<5} m={str(resultado['evaluaciones']):<7}"
+    if "omitido" in resultado:
+        print(f"{etiqueta} omitido ({resultado['omitido']})")
+        return
+    if "error" in resultado:
+        print(f"{etiqueta} ERROR ({resultado['error']})")
+        return
+    print(f"{etiqueta} {resultado['operaciones_por_segundo']:>14.1f} ops/s  "
+          f"p50={resultado['latencia_p50_s']:.3e}s  p99={resultado['latencia_p99_s']:.3e}s  "
+          f"pico={resultado['memoria_pico_bytes'] / 1024:.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks de interpolación de MetodosCalculo")
+    parser.add_argument("--nodos", type=int, nargs="+", default=NODOS_POR_DEFECTO,
+                        help="Números de nodos a probar")
+    parser.add_argument("--evaluaciones", type=int, nargs="+", default=EVALUACIONES_POR_DEFECTO,
+                        help="Números de valores de x evaluados por llamada")
+    parser.add_argument("--tiempo-minimo", type=float, default=0.2,
+                        help="Segundos mínimos de medición por combinación")
+    parser.add_argument("--repeticiones", type=int, default=200,
+                        help="Máximo de repeticiones por combinación")
+    parser.add_argument("--presupuesto", type=float, default=2e8,
+                        help="Omite combinaciones cuyo costo estimado supere este número de operaciones")
+    parser.add_argument("--filtro", default=None,
+                        help="Solo corre los kernels cuyo nombre contenga este texto")
+    parser.add_argument("--salida", default=None,
+                        help="Archivo JSON donde guardar los resultados")
+    args = parser.parse_args()
+
+    resultados = ejecutar(args.nodos, args.evaluaciones, args.tiempo_minimo,
+                          args.repeticiones, args.presupuesto, args.filtro)
+
+    if args.salida:
+        reporte = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "resultados": resultados,
+        }
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from tkinter import ttk, messagebox
 import numpy as np
 import random
 import math
-from metodos import MetodosCalculo
+from metodos import MetodosCalculo, ConjuntoPuntos
 
 class MathDefuserGame:
     def __init__(self, root):
@@ -58,29 +58,6 @@ class MathDefuserGame:
             "Newton-Cotes Abiertas"
         ]
         
-        # Tablas de constantes para Newton-Cotes
-        self.constantes_newton_cotes_cerradas = {
-            1: {"alpha": 1/2, "coef": [1, 1]},
-            2: {"alpha": 1/3, "coef": [1, 4, 1]},
-            3: {"alpha": 3/8, "coef": [1, 3, 3, 1]},
-            4: {"alpha": 2/45, "coef": [7, 32, 12, 32, 7]},
-            5: {"alpha": 5/288, "coef": [19, 75, 50, 50, 75, 19]},
-            6: {"alpha": 1/140, "coef": [41, 216, 27, 272, 27, 216, 41]},
-            7: {"alpha": 7/17280, "coef": [751, 3577, 1323, 2989, 2989, 1323, 3577, 751]},
-            8: {"alpha": 14/14175, "coef": [989, 5888, -928, 10946, -4540, 10946, -928, 5888, 989]},
-            9: {"alpha": 9/89600, "coef": [2857, 15741, 1080, 19344, 5788, 5788, 19344, 1080, 15741, 2857]},
-            10: {"alpha": 5/299376, "coef": [16067, 106300, -48525, 272400, -260550, 427368, -260550, 272400, -48525, 106300, 16067]}
-        }
-        
-        self.constantes_newton_cotes_abiertas = {
-            1: {"alpha": 3/2, "coef": [0, 1, 1, 0]},
-            2: {"alpha": 4/3, "coef": [0, 2, -1, 2, 0]},
-            3: {"alpha": 5/24, "coef": [0, 11, 1, 1, 11, 0]},
-            4: {"alpha": 6/20, "coef": [0, 11, -14, 26, -14, 11, 0]},
-            5: {"alpha": 7/1440, "coef": [0, 611, -453, 562, 562, -453, 611, 0]},
-            6: {"alpha": 8/945, "coef": [0, 460, -954, 2196, -2459, 2196, -954, 460, 0]}
-        }
-        
         # Estado del juego
         self.nivel_actual = 1
         self.vidas = 3
@@ -91,10 +68,12 @@ class MathDefuserGame:
         
         # Datos del problema actual
         self.puntos_detonados = []
+        self.conjunto_detonado = None  # ConjuntoPuntos con los puntos detonados
         self.bombas_ocultas = []  # Lista de tuplas (x, y_real)
         self.x_objetivo = []      # Valores X que el usuario debe encontrar
         self.funcion_real = None
         self.respuestas_correctas = {}
+        self.interpolante = None
         
         # Datos para la fase de desactivación
         self.problemas_desactivacion = []
@@ -106,6 +85,7 @@ class MathDefuserGame:
         self.problema_integracion_actual = None
         self.respuesta_integracion_correcta = None
         self.metodo_integracion_actual = None
+        self.n_integracion_actual = None
         
         # Instancia de métodos de cálculo
         self.metodos_calculo = MetodosCalculo()
@@ -146,6 +126,9 @@ class MathDefuserGame:
         else:  # Lagrange
             self.puntos_detonados = self.generar_puntos_mixtos_enteros(num_puntos)
         
+        # Orden, equiespaciado y paso se calculan una sola vez para todo el problema
+        self.conjunto_detonado = ConjuntoPuntos(self.puntos_detonados)
+        
         # Generar bombas objetivo (siempre enteras y dentro del rango)
         self.generar_bombas_objetivo_enteras()
         
@@ -160,6 +143,8 @@ class MathDefuserGame:
         print(f"Bombas objetivo (X): {self.x_objetivo}")
         print(f"Bombas ocultas: {self.bombas_ocultas}")
         print(f"Respuestas correctas: {self.respuestas_correctas}")
+        print(f"Interpolante coincide con la función real: "
+              f"{self.metodos_calculo.verificar_exactitud(self.interpolante, self.funcion_real)}")
     
     def generar_puntos_equiespaciados_enteros(self, num_puntos):
         """Genera puntos equiespaciados enteros para Newton hacia adelante/atrás"""
@@ -269,20 +254,15 @@ class MathDefuserGame:
         """Calcula las respuestas correctas usando el método de interpolación asignado"""
         self.respuestas_correctas = {}
         
-        # Ordenar puntos por X para los métodos que lo requieren
-        puntos_ordenados = sorted(self.puntos_detonados, key=lambda p: p[0])
-        
-        for x_objetivo, y_real in self.bombas_ocultas:
-            if self.metodo_actual == "Lagrange":
-                y_calculado = self.metodos_calculo.interpolacion_lagrange(x_objetivo, puntos_ordenados)
-            elif self.metodo_actual == "Newton hacia adelante":
-                y_calculado = self.metodos_calculo.interpolacion_newton_adelante(x_objetivo, puntos_ordenados)
-            elif self.metodo_actual == "Newton hacia atrás":
-                y_calculado = self.metodos_calculo.interpolacion_newton_atras(x_objetivo, puntos_ordenados)
-            else:  # Newton con diferencias divididas
-                y_calculado = self.metodos_calculo.interpolacion_diferencias_divididas(x_objetivo, puntos_ordenados)
-            
-            self.respuestas_correctas[x_objetivo] = y_calculado
+        # Construir el interpolante una sola vez por problema (se reutiliza al dibujar)
+        self.interpolante = self.metodos_calculo.crear_interpolante(self.conjunto_detonado, self.metodo_actual)
+        
+        # Evaluar todas las bombas objetivo en una sola llamada
+        x_objetivos = [x for x, y_real in self.bombas_ocultas]
+        y_calculados = self.interpolante(x_objetivos)
+        
+        for x_objetivo, y_calculado in zip(x_objetivos, y_calculados):
+            self.respuestas_correctas[x_objetivo] = float(y_calculado)
 
     def crear_interfaz_interpolacion(self):
         """Crea la interfaz para la fase de interpolación"""
@@ -413,8 +393,8 @@ class MathDefuserGame:
             return
         
         # Encontrar rango de coordenadas
-        todas_x = [p[0] for p in self.puntos_detonados] + [x for x, y in self.bombas_ocultas]
-        todas_y = [p[1] for p in self.puntos_detonados] + [y for x, y in self.bombas_ocultas]
+        todas_x = self.conjunto_detonado.x.tolist() + [x for x, y in self.bombas_ocultas]
+        todas_y = self.conjunto_detonado.y.tolist() + [y for x, y in self.bombas_ocultas]
         
         x_min, x_max = min(todas_x), max(todas_x)
         y_min, y_max = min(todas_y), max(todas_y)
@@ -484,34 +464,50 @@ class MathDefuserGame:
         
         # Dibujar línea de interpolación
         if len(self.puntos_detonados) >= 2:
-            puntos_ordenados = sorted(self.puntos_detonados, key=lambda p: p[0])
-            puntos_linea = []
+            # Muestrear la curva solo donde se curva, con un máximo de un punto por píxel
+            x_linea, y_linea = self.muestrear_curva_adaptativa(self.interpolante, x_min, x_max,
+                                                              a_pixel, max_puntos=ancho - 100)
             
-            for i in range(100):
-                x = x_min + (x_max - x_min) * (i / 99)
-                if self.metodo_actual == "Lagrange":
-                    y = self.metodos_calculo.interpolacion_lagrange(x, puntos_ordenados)
-                elif self.metodo_actual in ["Newton hacia adelante", "Newton hacia atrás"]:
-                    # Para métodos que requieren equiespaciados, verificar si podemos usarlos
-                    diferencias = [puntos_ordenados[i+1][0] - puntos_ordenados[i][0] for i in range(len(puntos_ordenados)-1)]
-                    if len(set(diferencias)) <= 1:
-                        if self.metodo_actual == "Newton hacia adelante":
-                            y = self.metodos_calculo.interpolacion_newton_adelante(x, puntos_ordenados)
-                        else:
-                            y = self.metodos_calculo.interpolacion_newton_atras(x, puntos_ordenados)
-                    else:
-                        y = self.metodos_calculo.interpolacion_diferencias_divididas(x, puntos_ordenados)
-                else:  # Newton con diferencias divididas
-                    y = self.metodos_calculo.interpolacion_diferencias_divididas(x, puntos_ordenados)
-                puntos_linea.append((x, y))
+            # Dibujar línea (un solo elemento del canvas para toda la curva)
+            px, py = a_pixel(x_linea, y_linea)
+            coordenadas = np.column_stack((px, py)).ravel().tolist()
+            self.canvas.create_line(*coordenadas,
+                                  fill=self.colors['accent_green'], width=2, dash=(5, 5))
+
+    def muestrear_curva_adaptativa(self, f, x_min, x_max, a_pixel, max_puntos,
+                                   tolerancia_px=0.5, segmentos_iniciales=16):
+        """Muestrea f subdividiendo solo los tramos cuyo error de cuerda en píxeles supera la tolerancia"""
+        x = np.linspace(x_min, x_max, segmentos_iniciales + 1)
+        y = f(x)
+        max_puntos = max(max_puntos, len(x))
+        activos = np.arange(len(x) - 1)  # Tramos (x[i], x[i+1]) que aún hay que revisar
+        
+        while len(activos) > 0 and len(x) < max_puntos:
+            # Evaluar los puntos medios de todos los tramos activos de una vez
+            x_medio = (x[activos] + x[activos + 1]) / 2
+            y_medio = f(x_medio)
             
-            # Dibujar línea
-            puntos_pixel = [a_pixel(x, y) for x, y in puntos_linea]
-            for i in range(len(puntos_pixel) - 1):
-                x1, y1 = puntos_pixel[i]
-                x2, y2 = puntos_pixel[i + 1]
-                self.canvas.create_line(x1, y1, x2, y2, 
-                                      fill=self.colors['accent_green'], width=2, dash=(5, 5))
+            # Distancia (en píxeles) entre el punto medio de la curva y el de la cuerda
+            px_izq, py_izq = a_pixel(x[activos], y[activos])
+            px_der, py_der = a_pixel(x[activos + 1], y[activos + 1])
+            px_medio, py_medio = a_pixel(x_medio, y_medio)
+            error = np.hypot(px_medio - (px_izq + px_der) / 2, py_medio - (py_izq + py_der) / 2)
+            
+            subdividir = np.nonzero(error > tolerancia_px)[0]
+            
+            # Si se excede el máximo, subdividir primero los tramos con mayor error
+            restantes = max_puntos - len(x)
+            if len(subdividir) > restantes:
+                subdividir = np.sort(subdividir[np.argsort(error[subdividir])[-restantes:]])
+            
+            # Insertar los puntos medios; cada tramo subdividido genera dos tramos activos
+            tramos = activos[subdividir]
+            x = np.insert(x, tramos + 1, x_medio[subdividir])
+            y = np.insert(y, tramos + 1, y_medio[subdividir])
+            nuevos = tramos + np.arange(len(tramos))  # Posición del tramo izquierdo tras insertar
+            activos = np.column_stack((nuevos, nuevos + 1)).ravel()
+        
+        return x, y
 
     def crear_panel_control(self, parent):
         """Crea el panel de control para ingresar respuestas"""
@@ -886,7 +882,7 @@ class MathDefuserGame:
         
         for i in range(num_bombas):
             metodo = metodos_disponibles[i]
-            problema, respuesta = self.metodos_calculo.generar_problema_por_metodo(metodo)
+            problema, respuesta = self.metodos_calculo.generar_problema_por_metodo(metodo, self.nivel_actual)
             
             self.problemas_desactivacion.append(problema)
             self.respuestas_desactivacion.append(respuesta)
@@ -1023,7 +1019,8 @@ class MathDefuserGame:
         if isinstance(respuesta_actual, list) and len(respuesta_actual) > 1:
             instrucciones_text = f"Resuelve el problema usando el método de {metodo_actual}.\nLa función tiene {len(respuesta_actual)} raíces válidas. Cualquiera de ellas es aceptable."
         elif isinstance(respuesta_actual, tuple):
-            instrucciones_text = f"Resuelve el problema usando el método de {metodo_actual}.\nIngresa los valores de x, y, z en los campos correspondientes:"
+            variables = ', '.join(self.metodos_calculo.nombres_variables(len(respuesta_actual)))
+            instrucciones_text = f"Resuelve el problema usando el método de {metodo_actual}.\nIngresa los valores de {variables} en los campos correspondientes:"
         else:
             instrucciones_text = f"Resuelve el problema usando el método de {metodo_actual}.\nIngresa el valor numérico resultante:"
 
@@ -1040,13 +1037,13 @@ class MathDefuserGame:
         entrada_frame = tk.Frame(respuesta_frame, bg=self.colors['medium_bg'])
         entrada_frame.pack(fill='x', padx=20, pady=20)
         
-        # Si es un sistema de ecuaciones, creamos tres entradas, sino una
+        # Si es un sistema de ecuaciones, creamos una entrada por incógnita, sino una
         if isinstance(respuesta_actual, tuple):
             self.entradas_desactivacion = []
             variables_frame = tk.Frame(entrada_frame, bg=self.colors['medium_bg'])
             variables_frame.pack(fill='x', pady=10)
             
-            for i, variable in enumerate(['x', 'y', 'z']):
+            for i, variable in enumerate(self.metodos_calculo.nombres_variables(len(respuesta_actual))):
                 sub_frame = tk.Frame(variables_frame, bg=self.colors['medium_bg'])
                 sub_frame.pack(fill='x', pady=5)
                 
@@ -1103,7 +1100,7 @@ class MathDefuserGame:
         
         try:
             if isinstance(respuesta_correcta, tuple):
-                # Para sistemas de ecuaciones 3x3, leemos tres entradas
+                # Para sistemas de ecuaciones, leemos una entrada por incógnita
                 valores = []
                 for entry in self.entradas_desactivacion:
                     valor = entry.get().strip()
@@ -1247,7 +1244,7 @@ Características:
 - Utiliza determinantes
 - Evita errores de redondeo al evitar divisiones
 
-Para sistemas 3x3, ingresa los valores de x, y, z en los campos correspondientes.
+Ingresa el valor de cada incógnita (x, y, z o x₁, x₂, ...) en los campos correspondientes.
 """,
             "Gauss-Jordan": """
 MÉTODO DE GAUSS-JORDAN
@@ -1261,7 +1258,7 @@ Ventajas:
 - Proporciona la solución directamente
 - No requiere sustitución hacia atrás
 
-Para sistemas 3x3, ingresa los valores de x, y, z en los campos correspondientes.
+Ingresa el valor de cada incógnita (x, y, z o x₁, x₂, ...) en los campos correspondientes.
 """,
             "Eliminación Gaussiana": """
 ELIMINACIÓN GAUSSIANA
@@ -1273,7 +1270,7 @@ Pasos:
 
 Es el método más común para resolver sistemas lineales.
 
-Para sistemas 3x3, ingresa los valores de x, y, z en los campos correspondientes.
+Ingresa el valor de cada incógnita (x, y, z o x₁, x₂, ...) en los campos correspondientes.
 """,
             "Gauss-Seidel": """
 MÉTODO DE GAUSS-SEIDEL
@@ -1284,7 +1281,7 @@ Características:
 - Converge más rápido que Jacobi
 - Requiere matriz diagonalmente dominante para convergencia garantizada
 
-Para sistemas 3x3, ingresa los valores de x, y, z en los campos correspondientes.
+Ingresa el valor de cada incógnita (x, y, z o x₁, x₂, ...) en los campos correspondientes.
 """,
             "Jacobi": """
 MÉTODO DE JACOBI
@@ -1295,7 +1292,7 @@ Características:
 - Más lento que Gauss-Seidel
 - Fácil de paralelizar
 
-Para sistemas 3x3, ingresa los valores de x, y, z en los campos correspondientes.
+Ingresa el valor de cada incógnita (x, y, z o x₁, x₂, ...) en los campos correspondientes.
 """,
             "Bisección": """
 MÉTODO DE LA BISECCIÓN
@@ -1483,16 +1480,17 @@ Características:
             problema, respuesta = self.metodos_calculo.generar_problema_simpson38(n)
         elif self.metodo_integracion_actual == "Newton-Cotes Cerradas":
             n = random.choice([4, 5, 6, 7])
-            problema, respuesta = self.metodos_calculo.generar_problema_newton_cotes_cerradas(n, self.constantes_newton_cotes_cerradas)
+            problema, respuesta = self.metodos_calculo.generar_problema_newton_cotes_cerradas(n)
         elif self.metodo_integracion_actual == "Newton-Cotes Abiertas":
             n = random.choice([2, 3, 4, 5])
-            problema, respuesta = self.metodos_calculo.generar_problema_newton_cotes_abiertas(n, self.constantes_newton_cotes_abiertas)
+            problema, respuesta = self.metodos_calculo.generar_problema_newton_cotes_abiertas(n)
         else:  # Regla Trapezoidal
             n = random.choice([1, 2, 3, 4, 5])
             problema, respuesta = self.metodos_calculo.generar_problema_trapezoidal(n)
         
         self.problema_integracion_actual = problema
         self.respuesta_integracion_correcta = respuesta
+        self.n_integracion_actual = n
         
         print(f"\n=== PROBLEMA DE INTEGRACIÓN ===")
         print(f"Método: {self.metodo_integracion_actual}")
@@ -1736,7 +1734,8 @@ Características:
 NEWTON-COTES CERRADAS
 
 Fórmula general:
-∫f(x)dx ≈ α · (b - a) · Σ [cᵢ · f(xᵢ)]
+∫f(x)dx ≈ α · h · Σ [cᵢ · f(xᵢ)]
+donde h = (b - a)/n y xᵢ = a + i·h (i = 0, ..., n)
 
 Características:
 - Usa puntos equiespaciados INCLUDYENDO extremos
@@ -1749,7 +1748,8 @@ Características:
 NEWTON-COTES ABIERTAS
 
 Fórmula general:
-∫f(x)dx ≈ α · (b - a) · Σ [cᵢ · f(xᵢ)]
+∫f(x)dx ≈ α · h · Σ [cᵢ · f(xᵢ)]
+donde h = (b - a)/(n + 2) y xᵢ = a + i·h (i = 1, ..., n + 1)
 
 Características:
 - Usa puntos equiespaciados EXCLUYENDO extremos
@@ -1762,32 +1762,14 @@ Características:
         
         ayuda = ayuda_textos.get(self.metodo_integracion_actual, "Información no disponible para este método.")
         
-        # Agregar constantes específicas para Newton-Cotes
-        if self.metodo_integracion_actual == "Newton-Cotes Cerradas":
-            n_actual = None
-            # Determinar n actual basado en el problema
-            for n in self.constantes_newton_cotes_cerradas:
-                if f"n={n}" in self.problema_integracion_actual:
-                    n_actual = n
-                    break
-            
-            if n_actual:
-                const = self.constantes_newton_cotes_cerradas[n_actual]
-                ayuda += f"\n\nConstantes para n={n_actual}:\n"
-                ayuda += f"α = {const['alpha']}\n"
-                ayuda += f"Coeficientes: {const['coef']}"
-        
-        elif self.metodo_integracion_actual == "Newton-Cotes Abiertas":
-            n_actual = None
-            for n in self.constantes_newton_cotes_abiertas:
-                if f"n={n}" in self.problema_integracion_actual:
-                    n_actual = n
-                    break
-            
-            if n_actual:
-                const = self.constantes_newton_cotes_abiertas[n_actual]
-                ayuda += f"\n\nConstantes para n={n_actual}:\n"
-                ayuda += f"α = {const['alpha']}\n"
-                ayuda += f"Coeficientes: {const['coef']}"
+        # Agregar constantes específicas para Newton-Cotes (las del n del problema actual)
+        if self.metodo_integracion_actual in ("Newton-Cotes Cerradas", "Newton-Cotes Abiertas"):
+            n_actual = self.n_integracion_actual
+            const = self.metodos_calculo.constantes_newton_cotes(
+                n_actual, abierta=self.metodo_integracion_actual == "Newton-Cotes Abiertas")
+            ayuda += f"\n\nConstantes para n={n_actual}:\n"
+            ayuda += f"α = {const['alpha']}\n"
+            ayuda += f"h = (b - a)/{const['intervalos']}\n"
+            ayuda += f"Coeficientes: {const['coef']}"
         
         messagebox.showinfo(f"Ayuda - {self.metodo_integracion_actual}", ayuda)
\ No newline at end of file
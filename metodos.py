@@ -1,150 +1,690 @@
 import numpy as np
 import random
 import math
+import json
+from fractions import Fraction
+from functools import lru_cache
+import os
+import time
+
+class ConjuntoPuntos:
+    """Conjunto inmutable de puntos (x, y) ordenados por x, con metadatos de espaciado"""
+    
+    def __init__(self, puntos, tolerancia=1e-9):
+        # (+ 0.0 normaliza -0.0 para que el hash sea consistente con la igualdad)
+        pares = sorted((float(px) + 0.0, float(py) + 0.0) for px, py in puntos)
+        x = np.array([p[0] for p in pares], dtype=float)
+        y = np.array([p[1] for p in pares], dtype=float)
+        x.flags.writeable = False
+        y.flags.writeable = False
+        
+        # Equiespaciado: todas las diferencias iguales dentro de la tolerancia (relativa al paso)
+        diferencias = np.diff(x)
+        equiespaciado = len(x) > 1 and bool(np.all(
+            np.abs(diferencias - diferencias[0]) <= tolerancia * max(1.0, abs(diferencias[0]))))
+        h = (x[-1] - x[0]) / (len(x) - 1) if equiespaciado else None
+        
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "equiespaciado", equiespaciado)
+        object.__setattr__(self, "h", h)
+        object.__setattr__(self, "_hash", hash((x.tobytes(), y.tobytes())))
+    
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("ConjuntoPuntos es inmutable")
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def __iter__(self):
+        return zip(self.x.tolist(), self.y.tolist())
+    
+    def __getitem__(self, i):
+        return float(self.x[i]), float(self.y[i])
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __eq__(self, otro):
+        if not isinstance(otro, ConjuntoPuntos):
+            return NotImplemented
+        return np.array_equal(self.x, otro.x) and np.array_equal(self.y, otro.y)
+    
+    def __repr__(self):
+        return f"ConjuntoPuntos({list(self)})"
+
+
+class Interpolante:
+    """Polinomio interpolante precompilado que se evalúa en forma de Newton anidada (Horner)"""
+    
+    def __init__(self, metodo, x, y, nodos, coeficientes, origen=0.0, escala=1.0, equiespaciado=False, h=None):
+        self.metodo = metodo
+        self.x = x                        # Nodos de interpolación
+        self.y = y                        # Valores en los nodos
+        self.equiespaciado = equiespaciado
+        self.h = h                        # Paso (solo si los nodos son equiespaciados)
+        
+        # La forma de Newton se evalúa en la variable s = (x - origen) / escala
+        self.nodos = nodos
+        self.coeficientes = coeficientes
+        self.origen = origen
+        self.escala = escala
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def evaluar(self, x):
+        """Evalúa el polinomio en x (escalar o arreglo) en O(n) por valor"""
+        x_arr = np.asarray(x, dtype=float)
+        s = (x_arr - self.origen) / self.escala
+        
+        # Esquema de Horner: c0 + (s - t0)(c1 + (s - t1)(c2 + ...))
+        resultado = np.full_like(s, self.coeficientes[-1])
+        for k in range(len(self.coeficientes) - 2, -1, -1):
+            resultado = resultado * (s - self.nodos[k]) + self.coeficientes[k]
+        
+        return float(resultado) if x_arr.ndim == 0 else resultado
+    
+    __call__ = evaluar
+    
+    def coeficientes_monomiales(self):
+        """Coeficientes del polinomio en potencias de x (mayor grado primero, como np.polyval)"""
+        # En x, la forma de Newton tiene nodos origen + escala·t_k y coeficientes c_k / escala^k
+        nodos_x = self.origen + self.escala * np.asarray(self.nodos, dtype=float)
+        coeficientes = np.asarray(self.coeficientes, dtype=float) / self.escala ** np.arange(len(self.coeficientes))
+        
+        # Expandir el esquema de Horner: p = (...(c_n-1)(x - x_n-2) + c_n-2)(x - x_n-3) + ...
+        polinomio = coeficientes[-1:].copy()
+        for k in range(len(coeficientes) - 2, -1, -1):
+            polinomio = np.append(polinomio, 0.0) - nodos_x[k] * np.insert(polinomio, 0, 0.0)
+            polinomio[-1] += coeficientes[k]
+        
+        return polinomio
+
+
+class InterpolanteBaricentrico:
+    """Interpolante de Lagrange en forma baricéntrica (segunda forma)"""
+    
+    def __init__(self, metodo, x, y):
+        self.metodo = metodo
+        self.x = np.array(x, dtype=float)  # Nodos (en orden de inserción)
+        self.y = np.array(y, dtype=float)
+        
+        # Factor de escala para evitar desbordamiento en los productos de los pesos;
+        # se cancela en la fórmula baricéntrica
+        amplitud = self.x.max() - self.x.min() if len(self.x) > 1 else 0.0
+        self.escala_pesos = 4.0 / amplitud if amplitud > 0 else 1.0
+        
+        # Pesos baricéntricos w_j = 1 / Π_{k≠j} (x_j - x_k), calculados una vez en O(n²)
+        n = len(self.x)
+        self.pesos = np.ones(n)
+        for j in range(n):
+            diferencias = self.escala_pesos * (self.x[j] - np.delete(self.x, j))
+            self.pesos[j] = 1.0 / np.prod(diferencias)
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def agregar_nodo(self, xk, yk):
+        """Agrega un nodo nuevo actualizando los pesos en O(n)"""
+        if np.any(self.x == xk):
+            raise ValueError(f"El nodo x = {xk} ya existe en el interpolante")
+        
+        diferencias = self.escala_pesos * (self.x - xk)
+        self.pesos = np.append(self.pesos / diferencias, 1.0 / np.prod(-diferencias))
+        self.x = np.append(self.x, float(xk))
+        self.y = np.append(self.y, float(yk))
+    
+    def evaluar(self, x):
+        """Evalúa el polinomio en x (escalar o arreglo) en O(n) por valor"""
+        x_arr = np.asarray(x, dtype=float)
+        valores = np.atleast_1d(x_arr)
+        numerador = np.zeros_like(valores)
+        denominador = np.zeros_like(valores)
+        en_nodo = np.full(valores.shape, -1)
+        
+        # p(x) = Σ w_j y_j / (x - x_j)  /  Σ w_j / (x - x_j)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for j in range(len(self.x)):
+                diferencia = valores - self.x[j]
+                en_nodo[diferencia == 0] = j
+                termino = self.pesos[j] / diferencia
+                numerador += termino * self.y[j]
+                denominador += termino
+            resultado = numerador / denominador
+        
+        # Si x coincide exactamente con un nodo, el valor es y_j
+        coincide = en_nodo >= 0
+        resultado[coincide] = self.y[en_nodo[coincide]]
+        
+        return float(resultado[0]) if x_arr.ndim == 0 else resultado.reshape(x_arr.shape)
+    
+    __call__ = evaluar
+    
+    def coeficientes_monomiales(self):
+        """Coeficientes del polinomio en potencias de x (mayor grado primero, como np.polyval)"""
+        n = len(self.x)
+        
+        # P(x) = Π (x - x_i), de grado n
+        producto = np.array([1.0])
+        for xi in self.x:
+            producto = np.append(producto, 0.0) - xi * np.insert(producto, 0, 0.0)
+        
+        # p(x) = Σ y_j w_j Π_{i≠j} (x - x_i); cada Π_{i≠j} se obtiene dividiendo P entre (x - x_j).
+        # Los pesos guardados están escalados por escala_pesos^(n-1), que aquí se deshace.
+        factor = self.escala_pesos ** (n - 1)
+        polinomio = np.zeros(n)
+        for j in range(n):
+            cociente = np.empty(n)
+            cociente[0] = producto[0]
+            for k in range(1, n):
+                cociente[k] = producto[k] + self.x[j] * cociente[k-1]
+            polinomio += (self.pesos[j] * factor * self.y[j]) * cociente
+        
+        return polinomio
+
+
+class TablaDiferenciasDivididas:
+    """Tabla de diferencias divididas incremental: acepta los puntos uno a uno"""
+    
+    def __init__(self, puntos=()):
+        self.x = []
+        self.y = []
+        self.coeficientes = []   # f[x0], f[x0,x1], ..., f[x0,...,xk] (forma de Newton)
+        self._diagonal = []      # f[xk], f[xk-1,xk], ..., f[x0,...,xk]
+        
+        for xk, yk in puntos:
+            self.agregar_punto(xk, yk)
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def agregar_punto(self, xk, yk):
+        """Agrega un punto calculando solo la nueva diagonal de la tabla en O(n)"""
+        if xk in self.x:
+            raise ValueError(f"El punto x = {xk} ya está en la tabla")
+        
+        nueva_diagonal = [float(yk)]
+        for j in range(1, len(self.x) + 1):
+            # f[xk-j,...,xk] = (f[xk-j+1,...,xk] - f[xk-j,...,xk-1]) / (xk - xk-j)
+            nueva_diagonal.append((nueva_diagonal[j-1] - self._diagonal[j-1]) / (xk - self.x[-j]))
+        
+        self._diagonal = nueva_diagonal
+        self.x.append(float(xk))
+        self.y.append(float(yk))
+        self.coeficientes.append(nueva_diagonal[-1])
+    
+    def interpolante(self, metodo="Newton con diferencias divididas"):
+        """Devuelve un Interpolante con los coeficientes actuales de la tabla"""
+        x = np.array(self.x)
+        return Interpolante(metodo, x, np.array(self.y), x, list(self.coeficientes))
+    
+    def evaluar(self, x):
+        """Evalúa el polinomio de Newton con los puntos agregados hasta ahora"""
+        return self.interpolante()(x)
+    
+    __call__ = evaluar
+
+
+class TablaTriangular:
+    """Tabla triangular de diferencias guardada por columnas en un búfer float64 contiguo"""
+    
+    def __init__(self, n):
+        self.n = n
+        # La columna j tiene n - j elementos: n(n+1)/2 en total en lugar de n²
+        self.datos = np.zeros(n * (n + 1) // 2)
+    
+    def __len__(self):
+        return self.n
+    
+    def _inicio(self, j):
+        """Posición en el búfer donde empieza la columna j"""
+        return j * self.n - j * (j - 1) // 2
+    
+    def columna(self, j):
+        """Vista (sin copia) de la columna j: elementos (0, j), (1, j), ..., (n-1-j, j)"""
+        inicio = self._inicio(j)
+        return self.datos[inicio:inicio + self.n - j]
+    
+    def __getitem__(self, indice):
+        """tabla[i, j] devuelve un elemento; tabla[i] devuelve la fila i (como en tabla[i][j])"""
+        if isinstance(indice, tuple):
+            i, j = indice
+            if not (0 <= j < self.n and 0 <= i < self.n - j):
+                raise IndexError(f"Índice ({i}, {j}) fuera de la tabla triangular")
+            return self.datos[self._inicio(j) + i]
+        
+        i = indice
+        j = np.arange(self.n - i)
+        return self.datos[j * self.n - j * (j - 1) // 2 + i]
+
+
+class TablaDiferenciasFinitas:
+    """Tabla única de diferencias finitas para las fórmulas hacia adelante, hacia atrás y centrales"""
+    
+    def __init__(self, conjunto, tabla):
+        if not conjunto.equiespaciado:
+            raise ValueError("Las diferencias finitas requieren puntos equiespaciados")
+        self.conjunto = conjunto
+        self.tabla = tabla      # TablaTriangular con Δ^j y_i en la posición (i, j)
+        self.n = len(conjunto)
+        self.x0 = conjunto.x[0]
+        self.h = conjunto.h
+    
+    def _evaluar(self, x, anclas, derecha_primero, grado):
+        """Forma de Newton que crece alrededor del nodo ancla alternando lados.
+        
+        Cada término agrega un nodo contiguo al bloque ya usado, por lo que su
+        coeficiente es una diferencia finita Δ^j y_inicio / j! de la tabla. Cuando
+        un lado se agota, el bloque sigue creciendo por el otro.
+        """
+        x_arr = np.asarray(x, dtype=float)
+        valores = np.atleast_1d(x_arr)
+        n = self.n
+        grado = n - 1 if grado is None else min(grado, n - 1)
+        anclas = np.broadcast_to(anclas, valores.shape)
+        
+        s = (valores - self.x0) / self.h - anclas  # s relativo al nodo ancla
+        inicio = anclas.copy()                     # Bloque de nodos usados: [inicio, fin]
+        fin = anclas.copy()
+        ultimo = np.zeros_like(s)                  # Último nodo agregado (relativo al ancla)
+        
+        resultado = self.conjunto.y[anclas].astype(float)
+        producto = np.ones_like(s)
+        
+        for j in range(1, grado + 1):
+            producto *= (s - ultimo) / j
+            prefiere_derecha = derecha_primero if j % 2 == 1 else not derecha_primero
+            derecha = np.where(fin >= n - 1, False, np.where(inicio <= 0, True, prefiere_derecha))
+            fin = np.where(derecha, fin + 1, fin)
+            inicio = np.where(derecha, inicio, inicio - 1)
+            ultimo = np.where(derecha, fin, inicio) - anclas
+            resultado += self.tabla.columna(j)[inicio] * producto
+        
+        return float(resultado[0]) if x_arr.ndim == 0 else resultado.reshape(x_arr.shape)
+    
+    def _nodo_cercano(self, x):
+        """Índice del nodo más cercano a cada x"""
+        return np.clip(np.rint((np.asarray(x, dtype=float) - self.x0) / self.h), 0, self.n - 1).astype(int)
+    
+    def adelante(self, x, grado=None):
+        """Fórmula de Newton hacia adelante (anclada en x0)"""
+        return self._evaluar(x, 0, True, grado)
+    
+    def atras(self, x, grado=None):
+        """Fórmula de Newton hacia atrás (anclada en xn)"""
+        return self._evaluar(x, self.n - 1, False, grado)
+    
+    def gauss_adelante(self, x, grado=None):
+        """Fórmula de Gauss hacia adelante anclada en el nodo más cercano a x"""
+        return self._evaluar(x, self._nodo_cercano(x), True, grado)
+    
+    def gauss_atras(self, x, grado=None):
+        """Fórmula de Gauss hacia atrás anclada en el nodo más cercano a x"""
+        return self._evaluar(x, self._nodo_cercano(x), False, grado)
+    
+    def stirling(self, x, grado=None):
+        """Fórmula de Stirling: promedio de Gauss hacia adelante y hacia atrás"""
+        anclas = self._nodo_cercano(x)
+        return (self._evaluar(x, anclas, True, grado) + self._evaluar(x, anclas, False, grado)) / 2
+    
+    def bessel(self, x, grado=None):
+        """Fórmula de Bessel: promedio de Gauss hacia adelante desde xk y hacia atrás desde xk+1"""
+        if self.n < 2:
+            return self._evaluar(x, 0, True, grado)
+        izquierda = np.clip(np.floor((np.asarray(x, dtype=float) - self.x0) / self.h), 0, self.n - 2).astype(int)
+        return (self._evaluar(x, izquierda, True, grado) + self._evaluar(x, izquierda + 1, False, grado)) / 2
+
+
+class MatrizDispersa:
+    """Matriz cuadrada en formato CSR: la fila i guarda sus columnas en indices[indptr[i]:indptr[i+1]]
+    y sus valores en data[indptr[i]:indptr[i+1]]; la memoria es proporcional a los no ceros.
+    """
+    
+    def __init__(self, indptr, indices, data):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.n = len(self.indptr) - 1
+        # Fila de cada valor guardado, para el producto matriz-vector vectorizado
+        self._filas = np.repeat(np.arange(self.n), np.diff(self.indptr))
+    
+    @classmethod
+    def desde_densa(cls, A):
+        """Construye la matriz CSR con los elementos no cero de una matriz densa"""
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(filas, minlength=len(A)))))
+        return cls(indptr, columnas, A[filas, columnas])
+    
+    @property
+    def shape(self):
+        return (self.n, self.n)
+    
+    def __matmul__(self, x):
+        """Producto A @ x sumando por filas los productos de todos los no ceros a la vez"""
+        return np.bincount(self._filas, weights=self.data * x[self.indices], minlength=self.n)
+    
+    def diagonal(self):
+        """Diagonal principal (ceros donde no hay elemento guardado)"""
+        diagonal = np.zeros(self.n)
+        en_diagonal = self.indices == self._filas
+        diagonal[self._filas[en_diagonal]] = self.data[en_diagonal]
+        return diagonal
+    
+    def fila(self, i):
+        """Columnas y valores (vistas) de los no ceros de la fila i"""
+        inicio, fin = self.indptr[i], self.indptr[i + 1]
+        return self.indices[inicio:fin], self.data[inicio:fin]
+
+
+class Telemetria:
+    """Cuenta evaluaciones y mide tiempo por sitio de llamada, agrupando por método.
+    
+    Desactivada, envolver() devuelve la misma función: no agrega ningún costo por llamada.
+    """
+    
+    def __init__(self, activa=False):
+        self.activa = activa
+        self.registros = {}  # (metodo, sitio) -> [llamadas, evaluaciones, segundos]
+    
+    def envolver(self, func, sitio, metodo=None):
+        """Devuelve func instrumentada (o la misma func si está desactivada o ya instrumentada)"""
+        if not self.activa or func is None or getattr(func, "_instrumentada", False):
+            return func
+        
+        registro = self.registros.setdefault((metodo or sitio, sitio), [0, 0, 0.0])
+        
+        def instrumentada(x, *args, **kwargs):
+            inicio = time.perf_counter()
+            resultado = func(x, *args, **kwargs)
+            registro[2] += time.perf_counter() - inicio
+            registro[0] += 1
+            registro[1] += np.size(x)  # Una llamada con un arreglo cuenta una evaluación por elemento
+            return resultado
+        
+        instrumentada._instrumentada = True
+        return instrumentada
+    
+    def reiniciar(self):
+        """Borra los contadores acumulados"""
+        self.registros = {}
+    
+    def resumen(self):
+        """Totales por método, con el detalle por sitio de llamada"""
+        resumen = {}
+        for (metodo, sitio), (llamadas, evaluaciones, segundos) in self.registros.items():
+            if llamadas == 0:
+                continue
+            total = resumen.setdefault(metodo, {"llamadas": 0, "evaluaciones": 0, "segundos": 0.0, "sitios": {}})
+            total["llamadas"] += llamadas
+            total["evaluaciones"] += evaluaciones
+            total["segundos"] += segundos
+            total["sitios"][sitio] = {"llamadas": llamadas, "evaluaciones": evaluaciones, "segundos": segundos}
+        return resumen
+
 
 class MetodosCalculo:
-    def __init__(self):
-        pass
+    # Versión del formato y de los buscadores de raíces de la caché en disco: cambiarla cuando
+    # cambie cómo se calculan las raíces, para que no se sirvan valores de versiones anteriores
+    VERSION_CACHE_RAICES = 3
+    
+    def __init__(self, archivo_raices=None, telemetria=False):
+        # Generador de NumPy para las operaciones por lotes
+        self.rng = np.random.default_rng()
+        
+        # Conteo de evaluaciones y tiempos de las funciones que pasan por esta clase
+        self.telemetria = Telemetria(activa=telemetria)
+        
+        # Catálogo de ecuaciones no lineales; las raíces se calculan solo cuando se piden.
+        # Los polinomios se guardan como coeficientes (mayor grado primero); las funciones
+        # trascendentes como expresiones de NumPy.
+        self.catalogo_ecuaciones = [
+            {
+                "func_str": "x³ - 6.5x + 2",
+                "coef": [1, 0, -6.5, 2],
+                "busqueda": (-5, 5),
+                "intervalo": [-3, 3]
+            },
+            {
+                "func_str": "3x³ - 2x - 3",
+                "coef": [3, 0, -2, -3],
+                "busqueda": (-2, 2),
+                "intervalo": [0, 2]
+            },
+            {
+                "func_str": "x³ + 2x² + 10x - 20",
+                "coef": [1, 2, 10, -20],
+                "busqueda": (0, 3),
+                "intervalo": [1, 2]
+            },
+            {
+                "func_str": "e^(-x) - x",
+                "func": lambda x: np.exp(-x) - x,
+                "derivada": lambda x: -np.exp(-x) - 1,
+                "busqueda": (-1, 2),
+                "intervalo": [0, 1]
+            },
+            {
+                "func_str": "x³ - 2x² - 5x + 6",
+                "coef": [1, -2, -5, 6],
+                "busqueda": (-3, 4),
+                "intervalo": [-2, 3]
+            },
+            {
+                "func_str": "x⁴ - 3x² + x - 1",
+                "coef": [1, 0, -3, 1, -1],
+                "busqueda": (-2, 2),
+                "intervalo": [-2, 2]
+            }
+        ]
+        
+        # Tablas de diferencias finitas por ConjuntoPuntos (inmutable), compartidas por las fórmulas de Newton
+        self._tablas_finitas = {}
+        
+        # Raíces ya calculadas por función (opcionalmente persistidas en un archivo JSON)
+        self.archivo_raices = archivo_raices
+        self._raices_catalogo = self._cargar_raices(archivo_raices)
+        
+        # Los polinomios también se pueden evaluar directamente (np.poly1d acepta arreglos)
+        for funcion in self.catalogo_ecuaciones:
+            if "coef" in funcion:
+                funcion["func"] = np.poly1d(funcion["coef"])
+                funcion["derivada"] = funcion["func"].deriv()
+    
+    def _preparar_x(self, x):
+        """Convierte x (escalar o arreglo) a un arreglo float64 e indica si era escalar"""
+        x_arr = np.asarray(x, dtype=float)
+        return x_arr, x_arr.ndim == 0
+    
+    def _resultado(self, resultado, es_escalar):
+        """Devuelve un float si la entrada fue escalar, o el arreglo completo"""
+        return float(resultado) if es_escalar else resultado
+    
+    def conjunto_puntos(self, puntos):
+        """Devuelve los puntos como ConjuntoPuntos (sin copiar si ya lo son)"""
+        if isinstance(puntos, ConjuntoPuntos):
+            return puntos
+        return ConjuntoPuntos(puntos)
     
     def interpolacion_lagrange(self, x, puntos):
-        """Interpolación de Lagrange"""
-        resultado = 0.0
-        n = len(puntos)
+        """Interpolación de Lagrange (x puede ser escalar o arreglo de NumPy)"""
+        conjunto = self.conjunto_puntos(puntos)
+        x, es_escalar = self._preparar_x(x)
+        resultado = np.zeros_like(x)
+        n = len(conjunto)
         
         for i in range(n):
-            xi, yi = puntos[i]
-            termino = yi
+            xi, yi = conjunto.x[i], conjunto.y[i]
+            termino = np.full_like(x, yi)
             
             for j in range(n):
                 if i != j:
-                    xj, yj = puntos[j]
+                    xj = conjunto.x[j]
                     termino *= (x - xj) / (xi - xj)
             
             resultado += termino
         
-        return resultado
+        return self._resultado(resultado, es_escalar)
+    
+    def interpolacion_lagrange_baricentrica(self, x, puntos):
+        """Interpolación de Lagrange en forma baricéntrica: O(n) por valor de x"""
+        conjunto = self.conjunto_puntos(puntos)
+        return InterpolanteBaricentrico("Lagrange", conjunto.x, conjunto.y)(x)
     
     def interpolacion_newton_adelante(self, x, puntos):
         """Interpolación de Newton hacia adelante (requiere puntos equiespaciados)"""
-        puntos_ordenados = sorted(puntos, key=lambda p: p[0])
-        n = len(puntos_ordenados)
+        conjunto = self.conjunto_puntos(puntos)
         
         # Verificar que los puntos sean equiespaciados
-        diferencias = [puntos_ordenados[i+1][0] - puntos_ordenados[i][0] for i in range(n-1)]
-        if len(set(diferencias)) > 1:
+        if not conjunto.equiespaciado:
             # Si no son equiespaciados, usar diferencias divididas como fallback
-            return self.interpolacion_diferencias_divididas(x, puntos_ordenados)
-        
-        # Calcular diferencias finitas
-        dif_finitas = self.calcular_diferencias_finitas(puntos_ordenados)
+            return self.interpolacion_diferencias_divididas(x, conjunto)
         
-        # Aplicar fórmula de Newton hacia adelante
-        h = diferencias[0]  # Paso (debe ser constante)
-        x0 = puntos_ordenados[0][0]
-        s = (x - x0) / h
-        
-        resultado = puntos_ordenados[0][1]  # f(x0)
-        producto = 1
-        
-        for i in range(1, n):
-            producto *= (s - (i - 1)) / i
-            resultado += dif_finitas[0][i] * producto
-        
-        return resultado
+        # Tabla compartida con Newton hacia atrás y las fórmulas centrales (se construye una vez)
+        return self.tabla_diferencias_finitas(conjunto).adelante(x)
     
     def interpolacion_newton_atras(self, x, puntos):
         """Interpolación de Newton hacia atrás (requiere puntos equiespaciados)"""
-        puntos_ordenados = sorted(puntos, key=lambda p: p[0])
-        n = len(puntos_ordenados)
+        conjunto = self.conjunto_puntos(puntos)
         
         # Verificar que los puntos sean equiespaciados
-        diferencias = [puntos_ordenados[i+1][0] - puntos_ordenados[i][0] for i in range(n-1)]
-        if len(set(diferencias)) > 1:
+        if not conjunto.equiespaciado:
             # Si no son equiespaciados, usar diferencias divididas como fallback
-            return self.interpolacion_diferencias_divididas(x, puntos_ordenados)
+            return self.interpolacion_diferencias_divididas(x, conjunto)
         
-        # Calcular diferencias finitas
-        dif_finitas = self.calcular_diferencias_finitas(puntos_ordenados)
-        
-        # Aplicar fórmula de Newton hacia atrás
-        h = diferencias[0]  # Paso (debe ser constante)
-        xn = puntos_ordenados[-1][0]
-        s = (x - xn) / h
-        
-        resultado = puntos_ordenados[-1][1]  # f(xn)
-        producto = 1
-        
-        for i in range(1, n):
-            producto *= (s + (i - 1)) / i
-            resultado += dif_finitas[n-i-1][i] * producto
-        
-        return resultado
+        # Tabla compartida con Newton hacia adelante y las fórmulas centrales (se construye una vez)
+        return self.tabla_diferencias_finitas(conjunto).atras(x)
+    
+    def _coordenadas(self, puntos):
+        """Arreglos x, y de los puntos en el orden recibido"""
+        if isinstance(puntos, ConjuntoPuntos):
+            return puntos.x, puntos.y
+        return (np.array([p[0] for p in puntos], dtype=float),
+                np.array([p[1] for p in puntos], dtype=float))
     
     def calcular_diferencias_finitas(self, puntos):
         """Calcula la tabla de diferencias finitas para puntos equiespaciados"""
-        n = len(puntos)
-        y = [p[1] for p in puntos]
-        
-        # Inicializar tabla
-        tabla = [[0] * n for _ in range(n)]
+        x, y = self._coordenadas(puntos)
+        n = len(y)
+        tabla = TablaTriangular(n)
         
         # Primera columna son los valores de y
-        for i in range(n):
-            tabla[i][0] = y[i]
+        tabla.columna(0)[:] = y
         
-        # Calcular diferencias finitas
+        # Calcular diferencias finitas columna por columna
         for j in range(1, n):
-            for i in range(n - j):
-                tabla[i][j] = tabla[i+1][j-1] - tabla[i][j-1]
+            anterior = tabla.columna(j-1)
+            tabla.columna(j)[:] = anterior[1:] - anterior[:-1]
         
         return tabla
     
+    def tabla_diferencias_finitas(self, puntos):
+        """Tabla de diferencias finitas para todas las fórmulas de Newton, construida una vez por conjunto"""
+        conjunto = self.conjunto_puntos(puntos)
+        tabla = self._tablas_finitas.pop(conjunto, None)
+        if tabla is None:
+            tabla = TablaDiferenciasFinitas(conjunto, self.calcular_diferencias_finitas(conjunto))
+            if len(self._tablas_finitas) >= 16:
+                # Descartar la tabla usada hace más tiempo
+                del self._tablas_finitas[next(iter(self._tablas_finitas))]
+        self._tablas_finitas[conjunto] = tabla  # Al final: la más reciente
+        return tabla
+    
     def interpolacion_diferencias_divididas(self, x, puntos):
         """Interpolación con diferencias divididas (funciona con puntos no equiespaciados)"""
-        puntos_ordenados = sorted(puntos, key=lambda p: p[0])
-        n = len(puntos_ordenados)
+        conjunto = self.conjunto_puntos(puntos)
+        n = len(conjunto)
+        x, es_escalar = self._preparar_x(x)
         
-        # Calcular diferencias divididas
-        dif_div = self.calcular_diferencias_divididas(puntos_ordenados)
+        # Calcular diferencias divididas (una sola vez para todos los valores de x)
+        dif_div = self.calcular_diferencias_divididas(conjunto)
         
         # Aplicar fórmula de Newton con diferencias divididas
-        resultado = puntos_ordenados[0][1]  # f[x0]
-        producto = 1
+        resultado = np.full_like(x, conjunto.y[0])  # f[x0]
+        producto = np.ones_like(x)
+        primera_fila = dif_div[0]
         
         for i in range(1, n):
-            producto *= (x - puntos_ordenados[i-1][0])
-            resultado += dif_div[0][i] * producto
+            producto *= (x - conjunto.x[i-1])
+            resultado += primera_fila[i] * producto
         
-        return resultado
+        return self._resultado(resultado, es_escalar)
     
     def calcular_diferencias_divididas(self, puntos):
         """Calcula la tabla de diferencias divididas"""
-        n = len(puntos)
-        x = [p[0] for p in puntos]
-        y = [p[1] for p in puntos]
-        
-        # Inicializar tabla
-        tabla = [[0] * n for _ in range(n)]
+        x, y = self._coordenadas(puntos)
+        n = len(y)
+        tabla = TablaTriangular(n)
         
         # Primera columna son los valores de y
-        for i in range(n):
-            tabla[i][0] = y[i]
+        tabla.columna(0)[:] = y
         
-        # Calcular diferencias divididas
+        # Calcular diferencias divididas columna por columna
         for j in range(1, n):
-            for i in range(n - j):
-                tabla[i][j] = (tabla[i+1][j-1] - tabla[i][j-1]) / (x[i+j] - x[i])
+            anterior = tabla.columna(j-1)
+            tabla.columna(j)[:] = (anterior[1:] - anterior[:-1]) / (x[j:] - x[:-j])
         
         return tabla
 
-    def generar_problema_por_metodo(self, metodo):
-        """Genera un problema específico para el método dado"""
+    def _inversos_factoriales(self, n):
+        """1/0!, 1/1!, ..., 1/(n-1)! acumulados en punto flotante (math.factorial desborda al convertir)"""
+        return np.cumprod(np.r_[1.0, 1.0 / np.arange(1, n)])
+    
+    def crear_interpolante(self, puntos, metodo):
+        """Construye un interpolante reutilizable para los puntos y el método dados"""
+        conjunto = self.conjunto_puntos(puntos)
+        n = len(conjunto)
+        x, y, h = conjunto.x, conjunto.y, conjunto.h
+        
+        if metodo == "Newton hacia adelante" and conjunto.equiespaciado:
+            # p(s) = y0 + Δy0·s + Δ²y0·s(s-1)/2! + ...   con s = (x - x0)/h
+            dif_finitas = self.tabla_diferencias_finitas(conjunto).tabla
+            coeficientes = dif_finitas[0] * self._inversos_factoriales(n)
+            return Interpolante(metodo, x, y, np.arange(n, dtype=float), coeficientes,
+                                origen=x[0], escala=h, equiespaciado=True, h=h)
+        
+        if metodo == "Newton hacia atrás" and conjunto.equiespaciado:
+            # p(s) = yn + ∇yn·s + ∇²yn·s(s+1)/2! + ...   con s = (x - xn)/h
+            dif_finitas = self.tabla_diferencias_finitas(conjunto).tabla
+            diagonal = np.array([dif_finitas[n-i-1, i] for i in range(n)])
+            coeficientes = diagonal * self._inversos_factoriales(n)
+            return Interpolante(metodo, x, y, -np.arange(n, dtype=float), coeficientes,
+                                origen=x[-1], escala=h, equiespaciado=True, h=h)
+        
+        if metodo == "Lagrange":
+            return InterpolanteBaricentrico(metodo, x, y)
+        
+        # Diferencias divididas (también como fallback de Newton cuando los puntos
+        # no son equiespaciados)
+        dif_div = self.calcular_diferencias_divididas(conjunto)
+        return Interpolante(metodo, x, y, x, dif_div[0], equiespaciado=conjunto.equiespaciado, h=h)
+    
+    def coeficientes_interpolacion(self, puntos, metodo):
+        """Coeficientes en potencias de x del polinomio que construye el método dado"""
+        return self.crear_interpolante(puntos, metodo).coeficientes_monomiales()
+    
+    def verificar_exactitud(self, interpolante, polinomio, tolerancia=1e-6):
+        """Compara coeficiente a coeficiente un interpolante con un polinomio (p. ej. np.poly1d)"""
+        a = np.trim_zeros(np.asarray(interpolante.coeficientes_monomiales(), dtype=float), 'f')
+        b = np.trim_zeros(np.asarray(getattr(polinomio, 'coeffs', polinomio), dtype=float), 'f')
+        
+        # Igualar grados rellenando con ceros a la izquierda
+        grado = max(len(a), len(b))
+        a = np.concatenate((np.zeros(grado - len(a)), a))
+        b = np.concatenate((np.zeros(grado - len(b)), b))
+        
+        escala = max(1.0, np.max(np.abs(b), initial=0.0))
+        return bool(np.all(np.abs(a - b) <= tolerancia * escala))
+    
+    def generar_problema_por_metodo(self, metodo, nivel=1):
+        """Genera un problema específico para el método dado (los sistemas crecen con el nivel)"""
         if metodo == "Interpolación lineal":
             return self.generar_problema_interpolacion_lineal()
         elif metodo in ["Montante", "Gauss-Jordan", "Eliminación Gaussiana"]:
-            return self.generar_problema_sistema_ecuaciones(metodo)
+            return self.generar_problema_sistema_ecuaciones(metodo, self.tamano_sistema(nivel))
         elif metodo in ["Gauss-Seidel", "Jacobi"]:
-            return self.generar_problema_sistema_diagonal_dominante(metodo)
+            return self.generar_problema_sistema_diagonal_dominante(metodo, self.tamano_sistema(nivel))
         else:  # Métodos para ecuaciones no lineales
             return self.generar_problema_ecuacion_no_lineal(metodo)
     
@@ -216,35 +756,19 @@ Estima el valor de {texto_objetivo} usando interpolación lineal con los puntos
 """
         return problema, respuesta
     
-    def generar_problema_sistema_ecuaciones(self, metodo):
-        """Genera un sistema de ecuaciones lineales 3x3 con coeficientes no cero en todas las variables"""
-        # Generar solución aleatoria
-        x = random.randint(-8, 8)
-        y = random.randint(-8, 8)
-        z = random.randint(-8, 8)
-
-        # MEJORA: Generar coeficientes no cero para todas las variables en todas las ecuaciones
-        def coef_no_cero():
-            return random.choice([i for i in range(-5, 6) if i != 0])
-        
-        # Generar coeficientes asegurando que ninguna variable tenga coeficiente cero
-        a11, a12, a13 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-        a21, a22, a23 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-        a31, a32, a33 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-
-        # Asegurar que el sistema tenga solución única
-        det = a11*(a22*a33 - a23*a32) - a12*(a21*a33 - a23*a31) + a13*(a21*a32 - a22*a31)
-        if abs(det) < 0.1:  # Si el determinante es casi cero, usar coeficientes por defecto
-            a11, a12, a13 = 2, -3, 1
-            a21, a22, a23 = -1, 2, 4
-            a31, a32, a33 = 3, 1, -2
-
-        # Calcular los términos independientes
-        b1 = a11*x + a12*y + a13*z
-        b2 = a21*x + a22*y + a23*z
-        b3 = a31*x + a32*y + a33*z
-
-        # Formatear los coeficientes para mostrar signos correctos
+    def tamano_sistema(self, nivel):
+        """Número de incógnitas de los sistemas lineales según el nivel: 3 al inicio, hasta 5"""
+        return min(3 + max(nivel - 1, 0) // 2, 5)
+    
+    def nombres_variables(self, n):
+        """Nombres de las incógnitas: x, y, z para sistemas 3x3 y x₁, ..., xₙ en otro caso"""
+        if n == 3:
+            return ['x', 'y', 'z']
+        subindices = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+        return [f"x{str(i).translate(subindices)}" for i in range(1, n + 1)]
+    
+    def _formatear_ecuacion(self, coeficientes, variables, termino):
+        """Escribe una ecuación lineal con los signos correctos; termino ya viene como texto"""
         def formato_coef(coef, variable):
             if coef == 1:
                 return f"+ {variable}" 
@@ -254,142 +778,199 @@ Estima el valor de {texto_objetivo} usando interpolación lineal con los puntos
                 return f"+ {coef}{variable}"
             else:
                 return f"- {abs(coef)}{variable}"
+        
+        primero = {1: '', -1: '-'}.get(coeficientes[0], coeficientes[0])
+        terminos = [f"{primero}{variables[0]}"]
+        terminos += [formato_coef(coef, variable) for coef, variable in zip(coeficientes[1:], variables[1:])]
+        return f"{' '.join(terminos)} = {termino}"
+    
+    def generar_sistemas_lote(self, n, cantidad=1, diagonal_dominante=False, cond_max=None):
+        """Genera `cantidad` matrices n x n enteras, bien condicionadas y sin coeficientes cero"""
+        # Por defecto se acepta la gran mayoría de los sorteos y solo se descartan los casi singulares
+        cond_max = 25 * n if cond_max is None else cond_max
+        aceptadas = []
+        faltan = cantidad
+        while faltan > 0:
+            # Se sortean de una vez K candidatas con coeficientes en ±{1, ..., 5}
+            k = max(2 * faltan, 16)
+            A = self.rng.integers(1, 6, size=(k, n, n)) * self.rng.choice([-1, 1], size=(k, n, n))
+            if diagonal_dominante:
+                # La diagonal supera la suma de los demás valores absolutos de su fila
+                fuera = np.abs(A).sum(axis=2) - np.abs(np.diagonal(A, axis1=1, axis2=2))
+                indices = np.arange(n)
+                A[:, indices, indices] = fuera + self.rng.integers(1, 4, size=(k, n))
+            
+            # Filtro por lotes: número de condición de todas las candidatas a la vez. Una matriz
+            # entera singular da cond ~1e16 o inf, así que cond <= cond_max ya garantiza det != 0
+            validas = A[np.linalg.cond(A) <= cond_max]
+            aceptadas.append(validas[:faltan])
+            faltan -= len(aceptadas[-1])
+        return np.concatenate(aceptadas)
+    
+    def generar_problema_sistema_ecuaciones(self, metodo, n=3):
+        """Genera un sistema de ecuaciones lineales n x n con coeficientes no cero en todas las variables"""
+        # Generar solución aleatoria y una matriz bien condicionada (det != 0) del lote
+        solucion = self.rng.integers(-8, 9, size=n)
+        A = self.generar_sistemas_lote(n)[0]
 
-        # Construir las ecuaciones
-        eq1 = f"{a11 if a11 != 1 else ''}{'x' if a11 != 0 else ''} {formato_coef(a12, 'y')} {formato_coef(a13, 'z')} = {b1}".strip()
-        eq2 = f"{a21 if a21 != 1 else ''}{'x' if a21 != 0 else ''} {formato_coef(a22, 'y')} {formato_coef(a23, 'z')} = {b2}".strip()
-        eq3 = f"{a31 if a31 != 1 else ''}{'x' if a31 != 0 else ''} {formato_coef(a32, 'y')} {formato_coef(a33, 'z')} = {b3}".strip()
+        # Calcular los términos independientes
+        b = A @ solucion
+
+        # La respuesta se obtiene con el método pedido, no se asume la solución sembrada
+        if metodo == "Montante":
+            determinante, numeradores = self.montante_entero(A, b)
+            respuesta = tuple(numerador / determinante for numerador in numeradores)
+        else:
+            respuesta = tuple(float(valor) for valor in self.resolver_sistema(A, b, metodo))
 
-        # Limpiar las ecuaciones (quitar espacios extra y posibles signos + al inicio)
-        import re
-        eq1 = re.sub(r'^\s*\+\s*', '', eq1)
-        eq2 = re.sub(r'^\s*\+\s*', '', eq2)
-        eq3 = re.sub(r'^\s*\+\s*', '', eq3)
+        variables = self.nombres_variables(n)
+        ecuaciones = "\n".join(self._formatear_ecuacion(fila, variables, termino) for fila, termino in zip(A, b))
 
         problema = f"""
 PROBLEMA DE SISTEMA DE ECUACIONES (Método: {metodo}):
 
-Resuelve el siguiente sistema 3x3 usando el método de {metodo}:
+Resuelve el siguiente sistema {n}x{n} usando el método de {metodo}:
 
-{eq1}
-{eq2}
-{eq3}
+{ecuaciones}
 
-Ingresa los valores de x, y, z.
+Ingresa los valores de {', '.join(variables)}.
 """
-        return problema, (x, y, z)
-    
-    def generar_problema_sistema_diagonal_dominante(self, metodo):
-        """Genera un sistema 3x3 diagonalmente dominante con coeficientes no cero"""
-        # Generar solución
-        x = random.uniform(-5, 5)
-        y = random.uniform(-5, 5)
-        z = random.uniform(-5, 5)
-
-        # MEJORA: Generar coeficientes no cero para todas las variables
-        def coef_no_cero():
-            return random.choice([i for i in range(-5, 6) if i != 0])
-        
-        # Generar coeficientes iniciales
-        a11, a12, a13 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-        a21, a22, a23 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-        a31, a32, a33 = coef_no_cero(), coef_no_cero(), coef_no_cero()
-
-        # Asegurar diagonal dominante
-        a11 = abs(a12) + abs(a13) + random.randint(1, 3)
-        a22 = abs(a21) + abs(a23) + random.randint(1, 3)
-        a33 = abs(a31) + abs(a32) + random.randint(1, 3)
-
-        # Calcular términos independientes
-        b1 = a11*x + a12*y + a13*z
-        b2 = a21*x + a22*y + a23*z
-        b3 = a31*x + a32*y + a33*z
-
-        # Formatear
-        def formato_coef(coef, variable):
-            if coef == 1:
-                return f"+ {variable}" 
-            elif coef == -1:
-                return f"- {variable}"
-            elif coef > 0:
-                return f"+ {coef}{variable}"
-            else:
-                return f"- {abs(coef)}{variable}"
+        return problema, respuesta
+    
+    def generar_problema_sistema_diagonal_dominante(self, metodo, n=3, max_barridos=15):
+        """Genera un sistema n x n diagonalmente dominante con coeficientes no cero"""
+        while True:
+            # Generar solución y una matriz diagonalmente dominante del lote (Jacobi y Gauss-Seidel convergen)
+            solucion = self.rng.uniform(-5, 5, size=n)
+            A = self.generar_sistemas_lote(n, diagonal_dominante=True)[0]
+            
+            # Descartar los sistemas que convergen demasiado lento: desde x = 0, cada barrido reduce
+            # el error por el radio espectral hasta la tolerancia de calificación (1% + 0.01)
+            radio = self.radio_espectral_iteracion(A, metodo)
+            tolerancia = np.min(np.abs(solucion) * 0.01 + 0.01)
+            if self.barridos_estimados(radio, np.max(np.abs(solucion)), tolerancia) <= max_barridos:
+                break
 
-        eq1 = f"{a11 if a11 != 1 else ''}{'x' if a11 != 0 else ''} {formato_coef(a12, 'y')} {formato_coef(a13, 'z')} = {b1:.2f}".strip()
-        eq2 = f"{a21 if a21 != 1 else ''}{'x' if a21 != 0 else ''} {formato_coef(a22, 'y')} {formato_coef(a23, 'z')} = {b2:.2f}".strip()
-        eq3 = f"{a31 if a31 != 1 else ''}{'x' if a31 != 0 else ''} {formato_coef(a32, 'y')} {formato_coef(a33, 'z')} = {b3:.2f}".strip()
+        # Calcular términos independientes (se muestran con dos decimales)
+        b = np.round(A @ solucion, 2)
 
-        # Limpiar
-        import re
-        eq1 = re.sub(r'^\s*\+\s*', '', eq1)
-        eq2 = re.sub(r'^\s*\+\s*', '', eq2)
-        eq3 = re.sub(r'^\s*\+\s*', '', eq3)
+        # La respuesta es la del sistema mostrado, resuelto con el método pedido
+        resolvedor = self.jacobi if metodo == "Jacobi" else self.gauss_seidel
+        solucion = resolvedor(A, b)["solucion"]
+
+        variables = self.nombres_variables(n)
+        ecuaciones = "\n".join(self._formatear_ecuacion(fila, variables, f"{termino:.2f}")
+                               for fila, termino in zip(A, b))
 
         problema = f"""
 PROBLEMA DE SISTEMA DE ECUACIONES (Método: {metodo}):
 
-Resuelve el siguiente sistema 3x3 usando el método de {metodo}:
+Resuelve el siguiente sistema {n}x{n} usando el método de {metodo}:
 
-{eq1}
-{eq2}
-{eq3}
+{ecuaciones}
 
-Ingresa los valores de x, y, z.
+Ingresa los valores de {', '.join(variables)}.
 """
-        return problema, (x, y, z)
+        return problema, tuple(float(valor) for valor in solucion)
+    
+    def raices_catalogo(self, funcion):
+        """Raíces reales de una función del catálogo, calculadas la primera vez que se piden"""
+        x_min, x_max = funcion["busqueda"]
+        clave = f"{funcion['func_str']} [{x_min}, {x_max}]"
+        
+        if clave not in self._raices_catalogo:
+            if "coef" in funcion:
+                # Polinomio: raíces exactas por valores propios, sin malla
+                self._raices_catalogo[clave] = self.raices_polinomio(funcion["coef"], x_min, x_max)
+            else:
+                func = self.telemetria.envolver(funcion["func"], funcion["func_str"], "Tabla de raíces")
+                self._raices_catalogo[clave] = self.encontrar_raices_reales(func, x_min, x_max,
+                                                                           refinador="brent")
+            self.guardar_raices()
+        
+        return list(self._raices_catalogo[clave])
+    
+    def raices_polinomio(self, coeficientes, x_min, x_max, tolerancia_imag=None, tolerancia_residuo=1e-10):
+        """Raíces reales de un polinomio en [x_min, x_max] como valores propios de su matriz compañera"""
+        coeficientes = np.trim_zeros(np.asarray(coeficientes, dtype=float), 'f')
+        grado = len(coeficientes) - 1
+        if grado < 1:
+            return []
+        
+        # Matriz compañera del polinomio mónico: sus valores propios son las raíces
+        companera = np.zeros((grado, grado))
+        companera[0, :] = -coeficientes[1:] / coeficientes[0]
+        companera[1:, :-1] = np.eye(grado - 1)
+        valores = np.linalg.eigvals(companera)
+        
+        # Una raíz de multiplicidad m suele separarse en valores con parte imaginaria del orden de
+        # eps^(1/m) (≈1e-8 para una doble): se admite una parte imaginaria de hasta ~1000·√eps y se
+        # confirma que el polinomio realmente se anule (residuo relativo) en la parte real
+        if tolerancia_imag is None:
+            tolerancia_imag = 1e3 * np.sqrt(np.finfo(float).eps)
+        x = valores.real
+        casi_reales = np.abs(valores.imag) <= tolerancia_imag * np.maximum(1.0, np.abs(valores))
+        residuo = np.abs(np.polyval(coeficientes, x))
+        magnitud = np.polyval(np.abs(coeficientes), np.abs(x))  # Escala de los términos sumados
+        reales = casi_reales & (residuo <= tolerancia_residuo * magnitud)
+        candidatos = np.sort(x[reales])
+        candidatos = candidatos[(candidatos >= x_min) & (candidatos <= x_max)]
+        
+        # Descartar raíces duplicadas (las dos partes de una raíz múltiple tienen la misma parte real)
+        raices = []
+        for raiz in candidatos.tolist():
+            if not any(abs(raiz - r) < 0.001 for r in raices):
+                raices.append(raiz)
+        
+        return raices
+    
+    def _cargar_raices(self, archivo_raices):
+        """Lee la caché de raíces; la ignora si es de otra versión o no tiene el formato esperado"""
+        if not archivo_raices or not os.path.exists(archivo_raices):
+            return {}
+        try:
+            with open(archivo_raices, encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(datos, dict) or datos.get("version") != self.VERSION_CACHE_RAICES:
+            return {}
+        raices = datos.get("raices")
+        if not isinstance(raices, dict):
+            return {}
+        # Solo entradas clave -> lista de números
+        return {clave: valores for clave, valores in raices.items()
+                if isinstance(clave, str) and isinstance(valores, list)
+                and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in valores)}
+    
+    def guardar_raices(self):
+        """Guarda las raíces calculadas en el archivo de caché (si se configuró uno)"""
+        if not self.archivo_raices:
+            return
+        try:
+            with open(self.archivo_raices, "w", encoding="utf-8") as archivo:
+                json.dump({"version": self.VERSION_CACHE_RAICES, "raices": self._raices_catalogo},
+                          archivo, ensure_ascii=False, indent=2)
+        except OSError:
+            pass  # La caché en disco es opcional: si no se puede escribir, se sigue en memoria
     
     def generar_problema_ecuacion_no_lineal(self, metodo):
         """Genera un problema de ecuación no lineal con múltiples raíces válidas"""
-        # Lista de funciones con sus raíces reales
-        funciones = [
-            {
-                "func_str": "x³ - 6.5x + 2",
-                "func": lambda x: x**3 - 6.5*x + 2,
-                "raices": self.encontrar_raices_reales(lambda x: x**3 - 6.5*x + 2, -5, 5),
-                "intervalo": [-3, 3]
-            },
-            {
-                "func_str": "3x³ - 2x - 3", 
-                "func": lambda x: 3*x**3 - 2*x - 3,
-                "raices": self.encontrar_raices_reales(lambda x: 3*x**3 - 2*x - 3, -2, 2),
-                "intervalo": [0, 2]
-            },
-            {
-                "func_str": "x³ + 2x² + 10x - 20",
-                "func": lambda x: x**3 + 2*x**2 + 10*x - 20,
-                "raices": self.encontrar_raices_reales(lambda x: x**3 + 2*x**2 + 10*x - 20, 0, 3),
-                "intervalo": [1, 2]
-            },
-            {
-                "func_str": "e^(-x) - x",
-                "func": lambda x: math.exp(-x) - x,
-                "raices": self.encontrar_raices_reales(lambda x: math.exp(-x) - x, -1, 2),
-                "intervalo": [0, 1]
-            },
-            {
-                "func_str": "x³ - 2x² - 5x + 6",
-                "func": lambda x: x**3 - 2*x**2 - 5*x + 6,
-                "raices": self.encontrar_raices_reales(lambda x: x**3 - 2*x**2 - 5*x + 6, -3, 4),
-                "intervalo": [-2, 3]
-            },
-            {
-                "func_str": "x⁴ - 3x² + x - 1",
-                "func": lambda x: x**4 - 3*x**2 + x - 1,
-                "raices": self.encontrar_raices_reales(lambda x: x**4 - 3*x**2 + x - 1, -2, 2),
-                "intervalo": [-2, 2]
-            }
-        ]
-        
-        funcion = random.choice(funciones)
+        funcion = random.choice(self.catalogo_ecuaciones)
         func_str = funcion["func_str"]
-        raices = funcion["raices"]
+        raices = self.raices_catalogo(funcion)
         intervalo = funcion["intervalo"]
         
         if not raices:
             # Si no se encontraron raíces, usar una por defecto
             raices = [random.uniform(intervalo[0], intervalo[1])]
         
+        # Instrumentar las funciones del catálogo que se usan para este método
+        funcion = dict(funcion,
+                       func=self.telemetria.envolver(funcion["func"], func_str, metodo),
+                       derivada=self.telemetria.envolver(funcion["derivada"], f"{func_str} (derivada)", metodo))
+        
         if metodo == "Bisección":
             # Para bisección, especificar el intervalo
             problema = f"""
@@ -412,8 +993,13 @@ La función tiene {len(raices)} raíz(es) real(es) en este intervalo.
 Cualquiera de ellas es aceptable como respuesta.
 """
         elif metodo == "Newton-Raphson":
-            # Para Newton-Raphson, sugerir un valor inicial
-            x0 = random.choice(raices) + random.uniform(-0.5, 0.5)
+            # Para Newton-Raphson, sugerir un valor inicial con convergencia comprobada:
+            # se prueban muchos candidatos a la vez y se elige uno que llegue a una raíz
+            candidatos = np.round(self.rng.choice(raices, 2000) + self.rng.uniform(-0.5, 0.5, 2000), 2)
+            resultado = self.resolver_multiarranque(metodo, funcion["func"], candidatos,
+                                                    derivada=funcion["derivada"], raices=raices)
+            elegido = self._elegir_arranque(resultado)
+            x0 = candidatos[elegido] if elegido is not None else candidatos[0]
             problema = f"""
 PROBLEMA DE ECUACIÓN NO LINEAL (Método: {metodo}):
 
@@ -426,9 +1012,15 @@ La función tiene {len(raices)} raíz(es) real(es).
 Cualquiera de ellas es aceptable como respuesta.
 """
         elif metodo == "Secante":
-            # Para secante, sugerir dos valores iniciales
-            x0 = random.choice(raices) + random.uniform(-0.8, -0.2)
-            x1 = random.choice(raices) + random.uniform(0.2, 0.8)
+            # Para secante, sugerir dos valores iniciales con convergencia comprobada
+            candidatos_x0 = np.round(self.rng.choice(raices, 2000) + self.rng.uniform(-0.8, -0.2, 2000), 2)
+            candidatos_x1 = np.round(self.rng.choice(raices, 2000) + self.rng.uniform(0.2, 0.8, 2000), 2)
+            resultado = self.resolver_multiarranque(metodo, funcion["func"], candidatos_x0, candidatos_x1,
+                                                    raices=raices)
+            elegido = self._elegir_arranque(resultado)
+            if elegido is None:
+                elegido = 0
+            x0, x1 = candidatos_x0[elegido], candidatos_x1[elegido]
             problema = f"""
 PROBLEMA DE ECUACIÓN NO LINEAL (Método: {metodo}):
 
@@ -441,14 +1033,39 @@ La función tiene {len(raices)} raíz(es) real(es).
 Cualquiera de ellas es aceptable como respuesta.
 """
         else:  # Punto Fijo
-            # Para punto fijo, mostrar la ecuación transformada
-            transformaciones = [
-                f"x = ({func_str.replace('f(x) = ', '')} + x) / 2",
-                f"x = -({func_str.replace('f(x) = ', '')}) + x",
-                f"x = ({func_str.replace('f(x) = ', '')}) / 10 + x"
-            ]
-            transformacion = random.choice(transformaciones)
-            x0 = random.choice(raices) + random.uniform(-0.3, 0.3)
+            # Para punto fijo, ofrecer solo transformaciones contractivas cerca de la raíz
+            raiz = random.choice(raices)
+            desplazamiento = random.uniform(-0.3, 0.3)
+            opciones = []
+            for _ in range(5):
+                x0 = round(raiz + desplazamiento, 2)
+                opciones = self.transformaciones_contractivas(funcion, raiz, x0, raices)
+                if opciones:
+                    break
+                desplazamiento /= 2  # Acercar el valor inicial a la raíz y volver a intentar
+            
+            if opciones:
+                transformacion, tasa = random.choice(opciones)
+            else:
+                # Ninguna es contractiva: relajación con c = f'(raíz) sin redondear (g'(raíz) = 0),
+                # achicando el tramo alrededor de la raíz hasta que |g'| < 1 en todo él
+                # (sin bajar de 0.02, porque x₀ se muestra con 2 decimales)
+                transformacion, g = self.relajacion_punto_fijo(funcion, raiz, decimales=None)
+                radio = abs(x0 - raiz) + 0.1
+                tasa = self.tasa_contraccion(g, raiz, radio)
+                while tasa >= 1 and radio / 2 >= 0.02:
+                    radio /= 2
+                    tasa = self.tasa_contraccion(g, raiz, radio)
+                if tasa >= 1:
+                    x0 = round(raiz, 2)  # Sin tramo contractivo (p. ej. raíz múltiple): partir de la raíz redondeada
+                elif abs(x0 - raiz) > radio / 2:
+                    x0 = round(raiz + math.copysign(radio / 2, x0 - raiz), 2)
+            
+            if tasa < 1:
+                aviso_tasa = (f"Cerca de la raíz |g'(x)| ≤ {tasa:.2f} "
+                              f"(el error se reduce aproximadamente en ese factor por iteración)")
+            else:
+                aviso_tasa = "Cerca de la raíz |g'(x)| no baja de 1: la convergencia puede ser lenta"
             
             problema = f"""
 PROBLEMA DE ECUACIÓN NO LINEAL (Método: {metodo}):
@@ -458,6 +1075,7 @@ f(x) = {func_str}
 
 Transformación sugerida: {transformacion}
 Valor inicial sugerido: x₀ = {x0:.2f}
+{aviso_tasa}
 
 La función tiene {len(raices)} raíz(es) real(es).
 Cualquiera de ellas es aceptable como respuesta.
@@ -466,38 +1084,882 @@ Cualquiera de ellas es aceptable como respuesta.
         # Devolver el problema y la lista de raíces válidas
         return problema, raices
     
-    def encontrar_raices_reales(self, func, x_min, x_max, num_puntos=1000):
-        """Encuentra raíces reales de una función en un intervalo dado"""
-        raices = []
+    def transformaciones_punto_fijo(self, funcion, raiz):
+        """Transformaciones x = g(x) candidatas para una función del catálogo, como (texto, g).
+        
+        Todas tienen como puntos fijos las raíces de f (no se incluye (f(x) + x)/2, cuyos
+        puntos fijos resuelven f(x) = x).
+        """
+        f = funcion["func"]
+        func_str = funcion["func_str"]
+        
+        return [
+            (f"x = -({func_str}) + x", lambda x: -f(x) + x),
+            (f"x = ({func_str}) / 10 + x", lambda x: f(x) / 10 + x),
+            self.relajacion_punto_fijo(funcion, raiz),
+        ]
+    
+    def relajacion_punto_fijo(self, funcion, raiz, decimales=1):
+        """Relajación x = x - f(x)/c con c = f'(raíz) (redondeado a `decimales`, o exacto con None)"""
+        f = funcion["func"]
+        func_str = funcion["func_str"]
+        
+        # Con c = f'(raíz) exacto, g'(raíz) = 0; redondeado, g'(raíz) ≈ 0
+        c = float(funcion["derivada"](raiz))
+        if decimales is not None:
+            c = round(c, decimales)
+        if c == 0:
+            c = 1.0
+        texto = (f"x = x - ({func_str}) / {c}" if c > 0
+                 else f"x = x + ({func_str}) / {abs(c)}")
+        return texto, lambda x: x - f(x) / c
+    
+    def tasa_contraccion(self, g, centro, radio, num_puntos=101):
+        """Máximo de |g'(x)| en [centro - radio, centro + radio] con derivada numérica vectorizada"""
+        x = np.linspace(centro - radio, centro + radio, num_puntos)
+        dh = 1e-6 * np.maximum(1.0, np.abs(x))
+        with np.errstate(all='ignore'):
+            derivadas = (g(x + dh) - g(x - dh)) / (2 * dh)
+        # Un valor no finito (fuera del dominio de g) cuenta como no contractivo
+        if not np.all(np.isfinite(derivadas)):
+            return float("inf")
+        return float(np.max(np.abs(derivadas)))
+    
+    def transformaciones_contractivas(self, funcion, raiz, x0, raices):
+        """Transformaciones con |g'| < 1 entre x0 y la raíz, cuya iteración desde x0 llega a una raíz"""
+        radio = abs(x0 - raiz) + 0.1
+        opciones = []
+        for texto, g in self.transformaciones_punto_fijo(funcion, raiz):
+            tasa = self.tasa_contraccion(g, raiz, radio)
+            if tasa >= 1:
+                continue
+            resultado = self.resolver_multiarranque("Punto Fijo", None, [x0], g=g, raices=raices, max_iter=200)
+            if resultado["indice_raiz"][0] >= 0:
+                opciones.append((texto, tasa))
+        return opciones
+    
+    def _evaluar_en_malla(self, func, x_vals):
+        """Evalúa func sobre un arreglo completo; si no acepta arreglos, la evalúa punto por punto"""
+        try:
+            y_vals = np.asarray(func(x_vals), dtype=float)
+            if y_vals.shape == x_vals.shape:
+                return y_vals
+        except (TypeError, ValueError):
+            pass
+        return np.array([func(x) for x in x_vals], dtype=float)
+    
+    def encontrar_raices_reales(self, func, x_min, x_max, num_puntos=1000, refinador="biseccion",
+                                tolerancia=1e-12, con_evaluaciones=False, tolerancia_tangencia=1e-10):
+        """Encuentra raíces reales de una función en un intervalo dado.
+        
+        refinador: "biseccion" (20 pasos vectorizados sobre todos los intervalos a la vez)
+        o cualquiera de los de refinar_raiz ("brent", "illinois", "newton").
+        Con con_evaluaciones=True devuelve (raices, evaluaciones de func). Las raíces sin
+        cambio de signo (tangencias) se aceptan solo si |f| refinado queda bajo tolerancia_tangencia.
+        """
+        func = self.telemetria.envolver(func, "func", "encontrar_raices_reales")
         x_vals = np.linspace(x_min, x_max, num_puntos)
-        y_vals = [func(x) for x in x_vals]
+        y_vals = self._evaluar_en_malla(func, x_vals)
+        evaluaciones = num_puntos
+        
+        # Buscar cambios de signo en toda la malla a la vez
+        cambios = np.nonzero(y_vals[:-1] * y_vals[1:] < 0)[0]
+        a, b = x_vals[cambios], x_vals[cambios + 1]
+        fa, fb = y_vals[cambios], y_vals[cambios + 1]
         
-        # Buscar cambios de signo
-        for i in range(1, len(x_vals)):
-            if y_vals[i-1] * y_vals[i] < 0:
-                # Hay una raíz en este intervalo, refinar con bisección
-                a, b = x_vals[i-1], x_vals[i]
+        if refinador == "biseccion":
+            # Refinar todos los intervalos simultáneamente con bisección
+            if len(cambios) > 0:
                 for _ in range(20):  # 20 iteraciones de bisección
                     c = (a + b) / 2
-                    if func(a) * func(c) < 0:
-                        b = c
+                    fc = self._evaluar_en_malla(func, c)
+                    izquierda = fa * fc < 0
+                    b = np.where(izquierda, c, b)
+                    a = np.where(izquierda, a, c)
+                    fa = np.where(izquierda, fa, fc)
+                evaluaciones += 20 * len(cambios)
+            candidatos = ((a + b) / 2).tolist()
+        else:
+            candidatos = []
+            for i in range(len(cambios)):
+                raiz, usadas = self.refinar_raiz(func, a[i], b[i], refinador, tolerancia,
+                                                 fa=fa[i], fb=fb[i])
+                candidatos.append(raiz)
+                evaluaciones += usadas
+        
+        # Ceros exactos sobre la malla (no aparecen como cambio de signo estricto)
+        candidatos += x_vals[y_vals == 0].tolist()
+        
+        # Puntos de tangencia: mínimos locales de |f| cerca de cero con ambos vecinos del mismo signo
+        # (así nunca están a menos de una celda de un cambio de signo ya refinado). Solo se aceptan
+        # si al refinar el mínimo la función llega realmente a cero.
+        centro = y_vals[1:-1]
+        minimos = np.nonzero((np.abs(centro) < 0.01) & (np.abs(centro) <= np.abs(y_vals[:-2]))
+                             & (np.abs(centro) <= np.abs(y_vals[2:]))
+                             & (y_vals[:-2] * centro > 0) & (centro * y_vals[2:] > 0))[0] + 1
+        if len(minimos) > 0:
+            x_t, f_t, usadas = self._refinar_tangencia(func, x_vals[minimos], x_vals[1] - x_vals[0])
+            evaluaciones += usadas
+            candidatos += x_t[np.abs(f_t) <= tolerancia_tangencia].tolist()
+        
+        # Descartar raíces duplicadas
+        raices = []
+        for raiz in candidatos:
+            if not any(abs(raiz - r) < 0.001 for r in raices):
+                raices.append(raiz)
+        
+        return (raices, evaluaciones) if con_evaluaciones else raices
+    
+    def _refinar_tangencia(self, func, x, h, iteraciones=8):
+        """Refina a la vez varios mínimos de |f| con vértices de parábolas sucesivas (paso h que se achica).
+        Devuelve (x, f(x), evaluaciones).
+        """
+        for _ in range(iteraciones):
+            y0 = self._evaluar_en_malla(func, x - h)
+            y1 = self._evaluar_en_malla(func, x)
+            y2 = self._evaluar_en_malla(func, x + h)
+            curvatura = y0 - 2 * y1 + y2
+            with np.errstate(divide='ignore', invalid='ignore'):
+                paso = np.where(curvatura != 0, h * (y0 - y2) / (2 * curvatura), 0.0)
+            x = x + np.clip(paso, -h, h)
+            h /= 4
+        return x, self._evaluar_en_malla(func, x), (3 * iteraciones + 1) * len(x)
+    
+    def refinar_raiz(self, func, a, b, metodo="brent", tolerancia=1e-12, max_iter=100,
+                     derivada=None, fa=None, fb=None):
+        """Refina la raíz de func en [a, b] (con cambio de signo). Devuelve (raiz, evaluaciones).
+        
+        metodo: "brent", "illinois" (falsa posición modificada) o "newton" (Newton
+        protegido con bisección). fa y fb evitan reevaluar extremos ya conocidos.
+        """
+        func = self.telemetria.envolver(func, "func", f"refinar_raiz ({metodo})")
+        derivada = self.telemetria.envolver(derivada, "derivada", f"refinar_raiz ({metodo})")
+        refinadores = {
+            "brent": self._refinar_brent,
+            "illinois": self._refinar_illinois,
+            "newton": self._refinar_newton,
+        }
+        if metodo not in refinadores:
+            raise ValueError(f"Refinador desconocido: {metodo}")
+        
+        evaluaciones = 0
+        if fa is None:
+            fa = func(a)
+            evaluaciones += 1
+        if fb is None:
+            fb = func(b)
+            evaluaciones += 1
+        a, b, fa, fb = float(a), float(b), float(fa), float(fb)
+        
+        if fa == 0:
+            return a, evaluaciones
+        if fb == 0:
+            return b, evaluaciones
+        if fa * fb > 0:
+            raise ValueError(f"La función no cambia de signo en [{a}, {b}]")
+        
+        raiz, usadas = refinadores[metodo](func, a, b, fa, fb, tolerancia, max_iter, derivada)
+        return float(raiz), evaluaciones + usadas
+    
+    def _refinar_brent(self, func, a, b, fa, fb, tolerancia, max_iter, derivada):
+        """Método de Brent (zeroin): interpolación inversa y secante protegidas con bisección"""
+        evaluaciones = 0
+        c, fc = a, fa
+        d = e = b - a
+        
+        for _ in range(max_iter):
+            if fb * fc > 0:
+                # La raíz quedó entre a y b: c vuelve a ser el extremo opuesto
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+            
+            tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * tolerancia
+            m = 0.5 * (c - b)
+            if abs(m) <= tol or fb == 0:
+                break
+            
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Secante
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    # Interpolación cuadrática inversa
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m  # La interpolación no es aceptable: bisección
+            else:
+                d = e = m
+            
+            a, fa = b, fb
+            b += d if abs(d) > tol else (tol if m > 0 else -tol)
+            fb = func(b)
+            evaluaciones += 1
+        
+        return b, evaluaciones
+    
+    def _refinar_illinois(self, func, a, b, fa, fb, tolerancia, max_iter, derivada):
+        """Falsa posición con la modificación de Illinois (evita que un extremo quede fijo)"""
+        evaluaciones = 0
+        
+        for _ in range(max_iter):
+            c = b - fb * (b - a) / (fb - fa)
+            fc = func(c)
+            evaluaciones += 1
+            
+            if fc * fb < 0:
+                a, fa = b, fb
+            else:
+                fa /= 2
+            b, fb = c, fc
+            
+            if fb == 0 or abs(b - a) <= tolerancia + 4 * np.finfo(float).eps * abs(b):
+                break
+        
+        return b, evaluaciones
+    
+    def _refinar_newton(self, func, a, b, fa, fb, tolerancia, max_iter, derivada):
+        """Newton-Raphson protegido: si el paso sale del intervalo o converge lento, usa bisección"""
+        evaluaciones = 0
+        if fa > 0:
+            a, b, fa, fb = b, a, fb, fa  # Mantener f(a) < 0 < f(b)
+        
+        x = (a + b) / 2
+        paso_anterior = abs(b - a)
+        paso = paso_anterior
+        
+        for _ in range(max_iter):
+            fx = func(x)
+            if derivada is not None:
+                dfx = derivada(x)
+                evaluaciones += 1
+            else:
+                dh = 1e-7 * max(1.0, abs(x))
+                dfx = (func(x + dh) - func(x - dh)) / (2 * dh)
+                evaluaciones += 2
+            evaluaciones += 1
+            
+            if fx == 0:
+                break
+            if fx < 0:
+                a = x
+            else:
+                b = x
+            
+            # Newton si el paso cae dentro del intervalo y reduce lo suficiente; si no, bisección
+            newton_x = x - fx / dfx if dfx != 0 else None
+            if (newton_x is None or not min(a, b) <= newton_x <= max(a, b)
+                    or abs(2 * fx) > abs(paso_anterior * dfx)):
+                paso_anterior, paso = paso, (b - a) / 2
+                x = a + paso
+            else:
+                paso_anterior, paso = paso, fx / dfx
+                x = newton_x
+            
+            if abs(paso) <= tolerancia:
+                break
+        
+        return x, evaluaciones
+
+    # MÉTODOS ITERATIVOS PARA ECUACIONES NO LINEALES
+    #
+    # Todos devuelven un diccionario con la raíz aproximada, si convergió, las evaluaciones
+    # de la función usadas y la traza de iteraciones: un arreglo (k, 3) con las columnas
+    # x, f(x) y error (|x_k - x_k-1|, o la mitad del intervalo en bisección). En punto fijo sin
+    # func, la segunda columna guarda el residuo de punto fijo g(x) - x en lugar de f(x).
+
+    def _resultado_iterativo(self, historial, k, raiz, convergio, evaluaciones):
+        """Arma el resultado de un método iterativo recortando la traza preasignada"""
+        return {
+            "raiz": float(raiz),
+            "convergio": convergio,
+            "evaluaciones": evaluaciones,
+            "iteraciones": historial[:k],
+        }
+
+    def _agotado(self, evaluaciones, max_evaluaciones):
+        """Indica si ya se alcanzó el límite de evaluaciones (None = sin límite)"""
+        return max_evaluaciones is not None and evaluaciones >= max_evaluaciones
+
+    def biseccion(self, func, a, b, tolerancia=1e-6, max_iter=100, max_evaluaciones=None):
+        """Método de bisección en [a, b]"""
+        func = self.telemetria.envolver(func, "func", "biseccion")
+        fa, fb = func(a), func(b)
+        evaluaciones = 2
+        if fa * fb > 0:
+            raise ValueError(f"La función no cambia de signo en [{a}, {b}]")
+        
+        historial = np.empty((max_iter, 3))
+        # Un extremo que ya es raíz se devuelve tal cual (si no, el intervalo se contrae hacia él sin fin)
+        if fa == 0 or fb == 0:
+            return self._resultado_iterativo(historial, 0, a if fa == 0 else b, True, evaluaciones)
+        c = (a + b) / 2
+        for k in range(max_iter):
+            if self._agotado(evaluaciones, max_evaluaciones):
+                return self._resultado_iterativo(historial, k, c, False, evaluaciones)
+            
+            c = (a + b) / 2
+            fc = func(c)
+            evaluaciones += 1
+            error = abs(b - a) / 2
+            historial[k] = (c, fc, error)
+            
+            if fc == 0 or error <= tolerancia:
+                return self._resultado_iterativo(historial, k + 1, c, True, evaluaciones)
+            if fa * fc < 0:
+                b, fb = c, fc
+            else:
+                a, fa = c, fc
+        
+        return self._resultado_iterativo(historial, max_iter, c, False, evaluaciones)
+
+    def falsa_posicion(self, func, a, b, tolerancia=1e-6, max_iter=100, max_evaluaciones=None):
+        """Método de falsa posición (regula falsi) en [a, b]"""
+        func = self.telemetria.envolver(func, "func", "falsa_posicion")
+        fa, fb = func(a), func(b)
+        evaluaciones = 2
+        if fa * fb > 0:
+            raise ValueError(f"La función no cambia de signo en [{a}, {b}]")
+        
+        historial = np.empty((max_iter, 3))
+        # Un extremo que ya es raíz se devuelve tal cual (si no, el intervalo se contrae hacia él sin fin)
+        if fa == 0 or fb == 0:
+            return self._resultado_iterativo(historial, 0, a if fa == 0 else b, True, evaluaciones)
+        c = anterior = a
+        for k in range(max_iter):
+            if self._agotado(evaluaciones, max_evaluaciones):
+                return self._resultado_iterativo(historial, k, c, False, evaluaciones)
+            
+            c = b - fb * (b - a) / (fb - fa)
+            fc = func(c)
+            evaluaciones += 1
+            error = abs(c - anterior) if k > 0 else np.nan
+            historial[k] = (c, fc, error)
+            
+            if fc == 0 or error <= tolerancia:
+                return self._resultado_iterativo(historial, k + 1, c, True, evaluaciones)
+            if fa * fc < 0:
+                b, fb = c, fc
+            else:
+                a, fa = c, fc
+            anterior = c
+        
+        return self._resultado_iterativo(historial, max_iter, c, False, evaluaciones)
+
+    def punto_fijo(self, g, x0, tolerancia=1e-6, max_iter=100, max_evaluaciones=None, func=None):
+        """Iteración de punto fijo x = g(x). Si se da func, la traza registra f(x) (y cada paso cuenta
+        dos evaluaciones: g y func); si no, registra el residuo de punto fijo g(x) - x
+        """
+        g = self.telemetria.envolver(g, "g", "punto_fijo")
+        func = self.telemetria.envolver(func, "func", "punto_fijo")
+        historial = np.empty((max_iter, 3))
+        evaluaciones = 0
+        x, error = x0, np.nan
+        
+        with np.errstate(all='ignore'):
+            for k in range(max_iter):
+                if self._agotado(evaluaciones, max_evaluaciones):
+                    return self._resultado_iterativo(historial, k, x, False, evaluaciones)
+                
+                try:
+                    siguiente = g(x)
+                    evaluaciones += 1
+                    if func is not None:
+                        residuo = func(x)
+                        evaluaciones += 1
                     else:
-                        a = c
-                raiz = (a + b) / 2
-                # Verificar que no sea una raíz duplicada
-                if not any(abs(raiz - r) < 0.001 for r in raices):
-                    raices.append(raiz)
-        
-        # También buscar raíces donde la función cruza cero sin cambio de signo (puntos de tangencia)
-        for i in range(1, len(x_vals)-1):
-            if abs(y_vals[i]) < 0.01 and (y_vals[i-1] * y_vals[i+1] <= 0):
-                raiz = x_vals[i]
-                if not any(abs(raiz - r) < 0.001 for r in raices):
-                    raices.append(raiz)
+                        residuo = siguiente - x
+                except (OverflowError, ZeroDivisionError):
+                    return self._resultado_iterativo(historial, k, x, False, evaluaciones)
+                historial[k] = (x, residuo, error)
+                
+                if error <= tolerancia or residuo == 0:
+                    return self._resultado_iterativo(historial, k + 1, x, True, evaluaciones)
+                if not np.isfinite(siguiente):
+                    return self._resultado_iterativo(historial, k + 1, x, False, evaluaciones)
+                
+                x, error = siguiente, abs(siguiente - x)
         
-        return raices
+        return self._resultado_iterativo(historial, max_iter, x, False, evaluaciones)
+
+    def newton_raphson(self, func, x0, derivada=None, tolerancia=1e-6, max_iter=100, max_evaluaciones=None):
+        """Método de Newton-Raphson. Sin derivada, usa una diferencia central"""
+        func = self.telemetria.envolver(func, "func", "newton_raphson")
+        derivada = self.telemetria.envolver(derivada, "derivada", "newton_raphson")
+        historial = np.empty((max_iter, 3))
+        evaluaciones = 0
+        x, error = x0, np.nan
+        
+        with np.errstate(all='ignore'):
+            for k in range(max_iter):
+                if self._agotado(evaluaciones, max_evaluaciones):
+                    return self._resultado_iterativo(historial, k, x, False, evaluaciones)
+                
+                try:
+                    fx = func(x)
+                    evaluaciones += 1
+                    historial[k] = (x, fx, error)
+                    if error <= tolerancia or fx == 0:
+                        return self._resultado_iterativo(historial, k + 1, x, True, evaluaciones)
+                    
+                    if derivada is not None:
+                        dfx = derivada(x)
+                        evaluaciones += 1
+                    else:
+                        dh = 1e-7 * max(1.0, abs(x))
+                        dfx = (func(x + dh) - func(x - dh)) / (2 * dh)
+                        evaluaciones += 2
+                    siguiente = x - fx / dfx
+                except (OverflowError, ZeroDivisionError):
+                    return self._resultado_iterativo(historial, k + 1, x, False, evaluaciones)
+                
+                if not np.isfinite(siguiente):
+                    return self._resultado_iterativo(historial, k + 1, x, False, evaluaciones)
+                x, error = siguiente, abs(siguiente - x)
+        
+        return self._resultado_iterativo(historial, max_iter, x, False, evaluaciones)
+
+    def secante(self, func, x0, x1, tolerancia=1e-6, max_iter=100, max_evaluaciones=None):
+        """Método de la secante a partir de x0 y x1"""
+        func = self.telemetria.envolver(func, "func", "secante")
+        historial = np.empty((max(max_iter, 2), 3))
+        f0, f1 = func(x0), func(x1)
+        evaluaciones = 2
+        historial[0] = (x0, f0, np.nan)
+        historial[1] = (x1, f1, abs(x1 - x0))
+        
+        with np.errstate(all='ignore'):
+            for k in range(2, max_iter):
+                if f1 == 0 or abs(x1 - x0) <= tolerancia:
+                    return self._resultado_iterativo(historial, k, x1, True, evaluaciones)
+                if self._agotado(evaluaciones, max_evaluaciones):
+                    return self._resultado_iterativo(historial, k, x1, False, evaluaciones)
+                
+                try:
+                    x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+                    f2 = func(x2)
+                except (OverflowError, ZeroDivisionError):
+                    return self._resultado_iterativo(historial, k, x1, False, evaluaciones)
+                evaluaciones += 1
+                historial[k] = (x2, f2, abs(x2 - x1))
+                
+                if not np.isfinite(x2):
+                    return self._resultado_iterativo(historial, k + 1, x1, False, evaluaciones)
+                x0, f0, x1, f1 = x1, f1, x2, f2
+        
+        convergio = f1 == 0 or abs(x1 - x0) <= tolerancia
+        return self._resultado_iterativo(historial, max_iter, x1, convergio, evaluaciones)
+
+    def resolver_multiarranque(self, metodo, func, x0, x1=None, derivada=None, g=None, raices=None,
+                               tolerancia=1e-6, max_iter=50):
+        """Corre Newton-Raphson, Secante o Punto Fijo desde muchos valores iniciales a la vez.
+        
+        x0 (y x1 para la secante) son arreglos; func, derivada y g deben aceptar arreglos.
+        Devuelve un diccionario de arreglos: raiz, convergio, pasos y, si se dan las raíces
+        conocidas, indice_raiz (posición en raices de la raíz alcanzada, o -1).
+        """
+        sitio_metodo = f"resolver_multiarranque ({metodo})"
+        func = self.telemetria.envolver(func, "func", sitio_metodo)
+        derivada = self.telemetria.envolver(derivada, "derivada", sitio_metodo)
+        g = self.telemetria.envolver(g, "g", sitio_metodo)
+        x = np.array(x0, dtype=float)
+        activos = np.ones(x.shape, dtype=bool)
+        convergio = np.zeros(x.shape, dtype=bool)
+        pasos = np.zeros(x.shape, dtype=int)
+        
+        if metodo == "Secante":
+            x_anterior, x = x, np.array(x1, dtype=float)
+            f_anterior = func(x_anterior)
+            fx = func(x)
+        
+        with np.errstate(all='ignore'):
+            for _ in range(max_iter):
+                indices = np.nonzero(activos)[0]
+                if len(indices) == 0:
+                    break
+                xa = x[indices]
+                
+                if metodo == "Newton-Raphson":
+                    if derivada is not None:
+                        dfx = derivada(xa)
+                    else:
+                        dh = 1e-7 * np.maximum(1.0, np.abs(xa))
+                        dfx = (func(xa + dh) - func(xa - dh)) / (2 * dh)
+                    nuevo = xa - func(xa) / dfx
+                elif metodo == "Secante":
+                    fa = fx[indices]
+                    nuevo = xa - fa * (xa - x_anterior[indices]) / (fa - f_anterior[indices])
+                    x_anterior[indices] = xa
+                    f_anterior[indices] = fa
+                    fx[indices] = func(nuevo)
+                elif metodo == "Punto Fijo":
+                    nuevo = g(xa)
+                else:
+                    raise ValueError(f"Método sin versión por lotes: {metodo}")
+                
+                x[indices] = nuevo
+                pasos[indices] += 1
+                
+                # Terminan los que ya no se mueven (convergieron) o se escaparon (inf/nan)
+                listos = np.abs(nuevo - xa) <= tolerancia
+                invalidos = ~np.isfinite(nuevo)
+                convergio[indices[listos & ~invalidos]] = True
+                activos[indices[listos | invalidos]] = False
+        
+        resultado = {"raiz": x, "convergio": convergio, "pasos": pasos}
+        
+        if raices is not None:
+            # Asociar cada arranque con la raíz conocida a la que llegó
+            raices = np.asarray(raices, dtype=float)
+            indice_raiz = np.full(x.shape, -1)
+            if len(raices) > 0:
+                distancias = np.abs(np.where(convergio, x, np.nan)[:, None] - raices[None, :])
+                cercana = np.argmin(np.nan_to_num(distancias, nan=np.inf), axis=1)
+                alcanzada = distancias[np.arange(len(x)), cercana] <= 1e-4 * np.maximum(1.0, np.abs(raices[cercana]))
+                indice_raiz[alcanzada] = cercana[alcanzada]
+            resultado["indice_raiz"] = indice_raiz
+        
+        return resultado
+    
+    def _elegir_arranque(self, resultado, pasos_min=2, pasos_max=10):
+        """Índice de un arranque que llega a una raíz conocida en un número razonable de pasos"""
+        llegan = resultado["indice_raiz"] >= 0
+        razonables = np.nonzero(llegan & (resultado["pasos"] >= pasos_min) & (resultado["pasos"] <= pasos_max))[0]
+        if len(razonables) == 0:
+            razonables = np.nonzero(llegan)[0]
+        if len(razonables) == 0:
+            return None
+        return int(self.rng.choice(razonables))
+    
+    # MÉTODOS DIRECTOS PARA SISTEMAS DE ECUACIONES LINEALES
+    #
+    # Trabajan sobre la matriz aumentada [A | b] de cualquier tamaño n x n; cada paso
+    # actualiza filas completas con una sola operación de arreglos.
+
+    def _matriz_aumentada(self, A, b):
+        """Arma la matriz aumentada [A | b] en punto flotante validando dimensiones"""
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).reshape(-1)
+        n = len(b)
+        if A.shape != (n, n):
+            raise ValueError(f"Se esperaba una matriz {n}x{n} y se recibió una de forma {A.shape}")
+        return np.column_stack((A, b))
+
+    def _pivotear(self, M, k, tolerancia):
+        """Intercambia la fila k con la de mayor |M[i, k]| (i >= k); falla si la columna es nula"""
+        p = k + int(np.argmax(np.abs(M[k:, k])))
+        if abs(M[p, k]) <= tolerancia:
+            raise ValueError("El sistema no tiene solución única (matriz singular)")
+        if p != k:
+            M[[k, p]] = M[[p, k]]
 
+    def eliminacion_gaussiana(self, A, b, tolerancia=1e-12):
+        """Eliminación gaussiana con pivoteo parcial y sustitución hacia atrás"""
+        M = self._matriz_aumentada(A, b)
+        n = len(M)
+        tolerancia *= max(1.0, np.max(np.abs(M[:, :n]), initial=0.0))
+        
+        for k in range(n):
+            self._pivotear(M, k, tolerancia)
+            # Anular la columna k debajo del pivote en todas las filas a la vez
+            factores = M[k + 1:, k] / M[k, k]
+            M[k + 1:, k:] -= np.outer(factores, M[k, k:])
+        
+        x = np.empty(n)
+        for i in range(n - 1, -1, -1):
+            x[i] = (M[i, n] - M[i, i + 1:n] @ x[i + 1:]) / M[i, i]
+        return x
+
+    def gauss_jordan(self, A, b, tolerancia=1e-12):
+        """Gauss-Jordan con pivoteo parcial: reduce [A | b] a [I | x]"""
+        M = self._matriz_aumentada(A, b)
+        n = len(M)
+        tolerancia *= max(1.0, np.max(np.abs(M[:, :n]), initial=0.0))
+        
+        for k in range(n):
+            self._pivotear(M, k, tolerancia)
+            M[k] /= M[k, k]
+            # Anular la columna k en todas las demás filas (arriba y abajo del pivote)
+            otras = np.arange(n) != k
+            M[otras] -= np.outer(M[otras, k], M[k])
+        return M[:, n].copy()
+
+    def montante(self, A, b, tolerancia=1e-12):
+        """Método de Montante: eliminación sin fracciones dividiendo entre el pivote anterior"""
+        M = self._matriz_aumentada(A, b)
+        n = len(M)
+        tolerancia *= max(1.0, np.max(np.abs(M[:, :n]), initial=0.0))
+        
+        pivote_anterior = 1.0
+        for k in range(n):
+            self._pivotear(M, k, tolerancia)
+            # Todas las filas salvo la del pivote: (pivote * fila - M[i, k] * fila_pivote) / pivote_anterior
+            otras = np.arange(n) != k
+            M[otras] = (M[k, k] * M[otras] - np.outer(M[otras, k], M[k])) / pivote_anterior
+            pivote_anterior = M[k, k]
+        
+        # Al final A queda como det * I y la última columna como det * x
+        return M[:, n] / pivote_anterior
+
+    def montante_entero(self, A, b=None):
+        """Montante exacto con enteros de Python: devuelve (determinante, numeradores) con x = numeradores / determinante"""
+        A = np.array(A, dtype=object)
+        n = len(A)
+        if A.shape != (n, n):
+            raise ValueError(f"Se esperaba una matriz cuadrada y se recibió una de forma {A.shape}")
+        columnas = [A] if b is None else [A, np.array(b, dtype=object).reshape(n, 1)]
+        M = np.hstack(columnas)
+        if any(valor != int(valor) for valor in M.flat):
+            raise ValueError("El método exacto requiere coeficientes enteros")
+        M = np.vectorize(int, otypes=[object])(M)
+        
+        signo = 1
+        pivote_anterior = 1
+        for k in range(n):
+            # Cualquier pivote no nulo sirve: la aritmética es exacta
+            candidatos = np.nonzero(M[k:, k])[0]
+            if len(candidatos) == 0:
+                return 0, None
+            p = k + int(candidatos[0])
+            if p != k:
+                M[[k, p]] = M[[p, k]]
+                signo = -signo
+            # Igual que en montante(), pero la división entre el pivote anterior es exacta
+            otras = np.arange(n) != k
+            M[otras] = (M[k, k] * M[otras] - np.outer(M[otras, k], M[k])) // pivote_anterior
+            pivote_anterior = M[k, k]
+        
+        determinante = signo * pivote_anterior
+        numeradores = None if b is None else [signo * valor for valor in M[:, n]]
+        return determinante, numeradores
+
+    def resolver_sistema(self, A, b, metodo):
+        """Resuelve A x = b con el método directo de nombre dado (nombres de la interfaz)"""
+        resolvedores = {
+            "Eliminación Gaussiana": self.eliminacion_gaussiana,
+            "Gauss-Jordan": self.gauss_jordan,
+            "Montante": self.montante,
+        }
+        if metodo not in resolvedores:
+            raise ValueError(f"Método directo desconocido: {metodo}")
+        return resolvedores[metodo](A, b)
+    
+    # MÉTODOS ITERATIVOS PARA SISTEMAS DE ECUACIONES LINEALES
+    #
+    # Aceptan una matriz densa o una MatrizDispersa (CSR). Se detienen cuando el residuo
+    # ||b - A x||∞ cae bajo tolerancia * max(1, ||b||∞) o al llegar a max_iter barridos.
+
+    def _preparar_iterativo(self, A, b, x0):
+        """Normaliza los datos de entrada y extrae la diagonal (que no puede tener ceros)"""
+        if not isinstance(A, MatrizDispersa):
+            A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float).reshape(-1)
+        if A.shape != (len(b), len(b)):
+            raise ValueError(f"Se esperaba una matriz {len(b)}x{len(b)} y se recibió una de forma {A.shape}")
+        diagonal = A.diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError("La matriz tiene ceros en la diagonal")
+        x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+        return A, b, x, diagonal
+
+    def _resultado_sistema(self, x, convergio, iteraciones, residuo):
+        """Arma el resultado de un método iterativo para sistemas"""
+        return {
+            "solucion": x,
+            "convergio": convergio,
+            "iteraciones": iteraciones,
+            "residuo": float(residuo),
+        }
+
+    def _barrido_gauss_seidel(self, A, diagonal):
+        """Devuelve una función que aplica en sitio un barrido de Gauss-Seidel a x para A x = b"""
+        if isinstance(A, MatrizDispersa):
+            filas = [A.fila(i) for i in range(A.n)]
+            producto_fila = lambda i, x: filas[i][1] @ x[filas[i][0]]
+        else:
+            producto_fila = lambda i, x: A[i] @ x
+        
+        def barrer(x, b):
+            for i in range(len(b)):
+                x[i] += (b[i] - producto_fila(i, x)) / diagonal[i]
+        return barrer
+
+    def jacobi(self, A, b, x0=None, tolerancia=1e-10, max_iter=500):
+        """Método de Jacobi: todas las incógnitas se actualizan a la vez con un producto matriz-vector"""
+        A, b, x, diagonal = self._preparar_iterativo(A, b, x0)
+        limite = tolerancia * max(1.0, np.max(np.abs(b), initial=0.0))
+        
+        residuo = b - A @ x
+        for k in range(max_iter):
+            error = np.max(np.abs(residuo), initial=0.0)
+            if error <= limite:
+                return self._resultado_sistema(x, True, k, error)
+            # x_i + (b_i - Σ a_ij x_j) / a_ii equivale a (b_i - Σ_{j≠i} a_ij x_j) / a_ii
+            x = x + residuo / diagonal
+            residuo = b - A @ x
+        
+        error = np.max(np.abs(residuo), initial=0.0)
+        return self._resultado_sistema(x, error <= limite, max_iter, error)
+
+    def gauss_seidel(self, A, b, x0=None, tolerancia=1e-10, max_iter=500):
+        """Método de Gauss-Seidel: barrido por filas usando los valores ya actualizados"""
+        A, b, x, diagonal = self._preparar_iterativo(A, b, x0)
+        limite = tolerancia * max(1.0, np.max(np.abs(b), initial=0.0))
+        barrer = self._barrido_gauss_seidel(A, diagonal)
+        
+        error = np.max(np.abs(b - A @ x), initial=0.0)
+        for k in range(max_iter):
+            if error <= limite:
+                return self._resultado_sistema(x, True, k, error)
+            barrer(x, b)
+            error = np.max(np.abs(b - A @ x), initial=0.0)
+        
+        return self._resultado_sistema(x, error <= limite, max_iter, error)
+    
+    def radio_espectral_iteracion(self, A, metodo, num_iter=30):
+        """Estima con el método de la potencia el radio espectral de la matriz de iteración de Jacobi o Gauss-Seidel"""
+        A, ceros, x, diagonal = self._preparar_iterativo(A, np.zeros(A.shape[0]), None)
+        if metodo == "Jacobi":
+            # T = I - D⁻¹A, aplicada sin formarla
+            aplicar = lambda x: x - (A @ x) / diagonal
+        else:
+            # T = -(D + L)⁻¹U: un barrido de Gauss-Seidel sobre A x = 0 transforma x en T x
+            barrer = self._barrido_gauss_seidel(A, diagonal)
+            aplicar = lambda x: (barrer(x, ceros), x)[1]
+        
+        x = self.rng.standard_normal(len(ceros))
+        x /= np.linalg.norm(x)
+        # Crecimiento logarítmico por paso; promediar la segunda mitad tolera autovalores complejos o negativos
+        crecimientos = np.empty(num_iter)
+        for k in range(num_iter):
+            x = aplicar(x)
+            norma = np.linalg.norm(x)
+            if norma == 0:
+                return 0.0
+            crecimientos[k] = np.log(norma)
+            x /= norma
+        return float(np.exp(np.mean(crecimientos[num_iter // 2:])))
+
+    def barridos_estimados(self, radio, error_inicial, tolerancia):
+        """Barridos para llevar el error de error_inicial a tolerancia si cada uno lo multiplica por radio"""
+        if error_inicial <= tolerancia:
+            return 0
+        if radio <= 0:
+            return 1
+        if radio >= 1:
+            return math.inf
+        return max(1, math.ceil(math.log(tolerancia / error_inicial) / math.log(radio)))
+    
     # MÉTODOS DE INTEGRACIÓN
+    #
+    # Todas las reglas se reducen a nodos t en [0, 1] y pesos w: ∫f ≈ (b - a) · Σ wᵢ f(a + tᵢ(b - a)),
+    # de modo que f se evalúa una sola vez sobre el arreglo completo de nodos.
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def pesos_newton_cotes(n, abierta=False):
+        """Pesos exactos (en unidades de h) de Newton-Cotes de grado n resolviendo las ecuaciones de momentos"""
+        if n < 1:
+            raise ValueError(f"El grado de Newton-Cotes debe ser al menos 1 (se recibió {n})")
+        # Cerradas: nodos 0..n sobre [0, n]; abiertas: nodos 1..n+1 sobre [0, n + 2]
+        nodos = range(1, n + 2) if abierta else range(0, n + 1)
+        longitud = n + 2 if abierta else n
+        
+        # Exactitud para 1, t, ..., tⁿ: Σ wᵢ tᵢᵏ = longitud^(k+1) / (k+1), en aritmética racional
+        M = [[Fraction(t) ** k for t in nodos] + [Fraction(longitud ** (k + 1), k + 1)] for k in range(n + 1)]
+        for k in range(n + 1):
+            p = next(i for i in range(k, n + 1) if M[i][k] != 0)
+            M[k], M[p] = M[p], M[k]
+            M[k] = [valor / M[k][k] for valor in M[k]]
+            for i in range(n + 1):
+                if i != k and M[i][k] != 0:
+                    M[i] = [valor - M[i][k] * pivote for valor, pivote in zip(M[i], M[k])]
+        return tuple(fila[-1] for fila in M)
+
+    def constantes_newton_cotes(self, n, abierta=False):
+        """Constantes de Newton-Cotes: ∫f ≈ α · h · Σ cᵢ f(xᵢ) con h = (b - a)/intervalos.
+        
+        Devuelve {"alpha", "coef", "intervalos"} con coeficientes enteros (las abiertas con ceros
+        en los extremos); intervalos es n en las cerradas y n + 2 en las abiertas.
+        """
+        pesos = self.pesos_newton_cotes(n, abierta)
+        # α = mcd de los numeradores / mcm de los denominadores, así los coeficientes quedan enteros y coprimos
+        alpha = Fraction(math.gcd(*(w.numerator for w in pesos)), math.lcm(*(w.denominator for w in pesos)))
+        coef = [int(w / alpha) for w in pesos]
+        if abierta:
+            return {"alpha": alpha, "coef": [0] + coef + [0], "intervalos": n + 2}
+        return {"alpha": alpha, "coef": coef, "intervalos": n}
+
+    def pesos_cuadratura(self, regla, n):
+        """Nodos relativos t y pesos w (que suman 1) de una regla compuesta o de Newton-Cotes de grado n"""
+        i = np.arange(n + 1)
+        t = i / n
+        if regla == "Regla Trapezoidal":
+            pesos = np.full(n + 1, 2.0)
+            pesos[0] = pesos[-1] = 1.0
+            pesos /= 2 * n
+        elif regla == "Regla de 1/3 Simpson":
+            if n % 2 != 0:
+                raise ValueError(f"La regla de 1/3 de Simpson requiere n par (se recibió {n})")
+            pesos = np.where(i % 2 == 0, 2.0, 4.0)
+            pesos[0] = pesos[-1] = 1.0
+            pesos /= 3 * n
+        elif regla == "Regla de 3/8 Simpson":
+            if n % 3 != 0:
+                raise ValueError(f"La regla de 3/8 de Simpson requiere n múltiplo de 3 (se recibió {n})")
+            pesos = np.where(i % 3 == 0, 2.0, 3.0)
+            pesos[0] = pesos[-1] = 1.0
+            pesos *= 3 / (8 * n)
+        elif regla == "Newton-Cotes Cerradas":
+            # ∫f ≈ α · h · Σ cᵢ f(xᵢ) con h = (b - a)/n: como fracción de (b - a) se divide entre n
+            constantes = self.constantes_newton_cotes(n)
+            pesos = float(constantes["alpha"]) * np.array(constantes["coef"], dtype=float) / constantes["intervalos"]
+        elif regla == "Newton-Cotes Abiertas":
+            # Sin los extremos: n + 1 nodos interiores con h = (b - a)/(n + 2)
+            constantes = self.constantes_newton_cotes(n, abierta=True)
+            coef = np.array(constantes["coef"][1:n + 2], dtype=float)
+            t = np.arange(1, n + 2) / constantes["intervalos"]
+            pesos = float(constantes["alpha"]) * coef / constantes["intervalos"]
+        else:
+            raise ValueError(f"Regla de integración desconocida: {regla}")
+        
+        # Toda regla integra exactamente las constantes: sus pesos relativos deben sumar 1
+        if not np.isclose(pesos.sum(), 1.0):
+            raise ValueError(f"Los pesos de {regla} (n={n}) suman {pesos.sum()}, no 1")
+        return t, pesos
+
+    def integrar(self, f, a, b, regla, n):
+        """Aproxima ∫f de a a b con la regla dada; f debe aceptar arreglos (np.sin, np.exp, ...)"""
+        t, pesos = self.pesos_cuadratura(regla, n)
+        x = a + (b - a) * t
+        return float((b - a) * (pesos @ f(x)))
+
+    def verificar_cuadratura(self, regla, n, a=-1.0, b=2.0, tolerancia=1e-9):
+        """Comprueba que la regla integre exactamente xᵏ en [a, b] hasta su grado de exactitud"""
+        if regla in ("Newton-Cotes Cerradas", "Newton-Cotes Abiertas"):
+            grado = n + 1 if n % 2 == 0 else n  # Con un número impar de nodos se gana un grado
+        else:
+            grado = {"Regla Trapezoidal": 1, "Regla de 1/3 Simpson": 3, "Regla de 3/8 Simpson": 3}[regla]
+        
+        for k in range(grado + 1):
+            exacta = (b ** (k + 1) - a ** (k + 1)) / (k + 1)
+            aproximada = self.integrar(lambda x: x ** k, a, b, regla, n)
+            if abs(aproximada - exacta) > tolerancia * max(1.0, abs(exacta)):
+                return False
+        return True
 
     def generar_problema_trapezoidal(self, n):
         """Genera problema para regla trapezoidal"""
@@ -505,10 +1967,10 @@ Cualquiera de ellas es aceptable como respuesta.
         funciones = [
             {"func": lambda x: 1 - x**2, "a": 0, "b": 1, "desc": "1 - x²"},
             {"func": lambda x: x**3 + 2*x, "a": 0, "b": 2, "desc": "x³ + 2x"},
-            {"func": lambda x: math.sin(x), "a": 0, "b": math.pi, "desc": "sin(x)"},
-            {"func": lambda x: math.exp(x), "a": 0, "b": 1, "desc": "eˣ"},
+            {"func": lambda x: np.sin(x), "a": 0, "b": np.pi, "desc": "sin(x)"},
+            {"func": lambda x: np.exp(x), "a": 0, "b": 1, "desc": "eˣ"},
             {"func": lambda x: 3*x**2 - 2*x + 1, "a": -1, "b": 1, "desc": "3x² - 2x + 1"},
-            {"func": lambda x: math.cos(x), "a": 0, "b": math.pi/2, "desc": "cos(x)"}
+            {"func": lambda x: np.cos(x), "a": 0, "b": np.pi/2, "desc": "cos(x)"}
         ]
         
         funcion_elegida = random.choice(funciones)
@@ -516,13 +1978,10 @@ Cualquiera de ellas es aceptable como respuesta.
         a = funcion_elegida["a"]
         b = funcion_elegida["b"]
         desc = funcion_elegida["desc"]
+        f = self.telemetria.envolver(f, desc, "Regla Trapezoidal")
         
         # Calcular respuesta usando regla trapezoidal
-        h = (b - a) / n
-        resultado = (f(a) + f(b)) / 2
-        for i in range(1, n):
-            resultado += f(a + i * h)
-        resultado *= h
+        resultado = self.integrar(f, a, b, "Regla Trapezoidal", n)
         
         problema = f"""
 PROBLEMA DE INTEGRACIÓN - REGLA TRAPEZOIDAL
@@ -546,8 +2005,8 @@ donde h = (b - a)/n
         funciones = [
             {"func": lambda x: 1 - x**2, "a": 0, "b": 1, "desc": "1 - x²"},
             {"func": lambda x: x**4 - 2*x**2 + 1, "a": -1, "b": 1, "desc": "x⁴ - 2x² + 1"},
-            {"func": lambda x: math.sin(x), "a": 0, "b": math.pi, "desc": "sin(x)"},
-            {"func": lambda x: math.exp(-x**2), "a": 0, "b": 1, "desc": "e^(-x²)"},
+            {"func": lambda x: np.sin(x), "a": 0, "b": np.pi, "desc": "sin(x)"},
+            {"func": lambda x: np.exp(-x**2), "a": 0, "b": 1, "desc": "e^(-x²)"},
             {"func": lambda x: 1/(1+x**2), "a": 0, "b": 1, "desc": "1/(1+x²)"}
         ]
         
@@ -556,18 +2015,10 @@ donde h = (b - a)/n
         a = funcion_elegida["a"]
         b = funcion_elegida["b"]
         desc = funcion_elegida["desc"]
+        f = self.telemetria.envolver(f, desc, "Regla de 1/3 Simpson")
         
         # Calcular respuesta usando regla de 1/3 de Simpson
-        h = (b - a) / n
-        resultado = f(a) + f(b)
-        
-        for i in range(1, n):
-            if i % 2 == 0:
-                resultado += 2 * f(a + i * h)
-            else:
-                resultado += 4 * f(a + i * h)
-        
-        resultado *= h / 3
+        resultado = self.integrar(f, a, b, "Regla de 1/3 Simpson", n)
         
         problema = f"""
 PROBLEMA DE INTEGRACIÓN - REGLA DE 1/3 DE SIMPSON
@@ -591,9 +2042,9 @@ donde h = (b - a)/n
         funciones = [
             {"func": lambda x: 1 - x**2, "a": 0, "b": 1, "desc": "1 - x²"},
             {"func": lambda x: x**3 + x, "a": 0, "b": 2, "desc": "x³ + x"},
-            {"func": lambda x: math.cos(x), "a": 0, "b": math.pi/2, "desc": "cos(x)"},
-            {"func": lambda x: math.log(1 + x), "a": 0, "b": 1, "desc": "ln(1+x)"},
-            {"func": lambda x: math.sqrt(1 + x), "a": 0, "b": 1, "desc": "√(1+x)"}
+            {"func": lambda x: np.cos(x), "a": 0, "b": np.pi/2, "desc": "cos(x)"},
+            {"func": lambda x: np.log(1 + x), "a": 0, "b": 1, "desc": "ln(1+x)"},
+            {"func": lambda x: np.sqrt(1 + x), "a": 0, "b": 1, "desc": "√(1+x)"}
         ]
         
         funcion_elegida = random.choice(funciones)
@@ -601,18 +2052,10 @@ donde h = (b - a)/n
         a = funcion_elegida["a"]
         b = funcion_elegida["b"]
         desc = funcion_elegida["desc"]
+        f = self.telemetria.envolver(f, desc, "Regla de 3/8 Simpson")
         
         # Calcular respuesta usando regla de 3/8 de Simpson
-        h = (b - a) / n
-        resultado = f(a) + f(b)
-        
-        for i in range(1, n):
-            if i % 3 == 0:
-                resultado += 2 * f(a + i * h)
-            else:
-                resultado += 3 * f(a + i * h)
-        
-        resultado *= 3 * h / 8
+        resultado = self.integrar(f, a, b, "Regla de 3/8 Simpson", n)
         
         problema = f"""
 PROBLEMA DE INTEGRACIÓN - REGLA DE 3/8 DE SIMPSON
@@ -631,13 +2074,13 @@ donde h = (b - a)/n
 """
         return problema, resultado
 
-    def generar_problema_newton_cotes_cerradas(self, n, constantes_newton_cotes_cerradas):
+    def generar_problema_newton_cotes_cerradas(self, n):
         """Genera problema para Newton-Cotes Cerradas"""
         funciones = [
             {"func": lambda x: 1 - x**2, "a": 0, "b": 1, "desc": "1 - x²"},
             {"func": lambda x: x**4, "a": 0, "b": 1, "desc": "x⁴"},
-            {"func": lambda x: math.sin(x), "a": 0, "b": math.pi, "desc": "sin(x)"},
-            {"func": lambda x: math.exp(x), "a": 0, "b": 1, "desc": "eˣ"}
+            {"func": lambda x: np.sin(x), "a": 0, "b": np.pi, "desc": "sin(x)"},
+            {"func": lambda x: np.exp(x), "a": 0, "b": 1, "desc": "eˣ"}
         ]
         
         funcion_elegida = random.choice(funciones)
@@ -645,22 +2088,16 @@ donde h = (b - a)/n
         a = funcion_elegida["a"]
         b = funcion_elegida["b"]
         desc = funcion_elegida["desc"]
+        f = self.telemetria.envolver(f, desc, "Newton-Cotes Cerradas")
         
-        # Obtener constantes de la tabla
-        constantes = constantes_newton_cotes_cerradas.get(n)
-        if not constantes:
-            n = 4  # Valor por defecto
-            constantes = constantes_newton_cotes_cerradas[n]
+        # Obtener constantes (exactas y en caché para cualquier n)
+        constantes = self.constantes_newton_cotes(n)
         
         alpha = constantes["alpha"]
         coef = constantes["coef"]
         
         # Calcular respuesta usando Newton-Cotes Cerradas
-        h = (b - a) / n
-        resultado = 0
-        for i in range(n + 1):
-            resultado += coef[i] * f(a + i * h)
-        resultado *= alpha * (b - a)
+        resultado = self.integrar(f, a, b, "Newton-Cotes Cerradas", n)
         
         # Formatear coeficientes para mostrar
         coef_str = " + ".join([f"{coef[i]}·f(x{i})" for i in range(len(coef))])
@@ -675,23 +2112,24 @@ Desde x = {a} hasta x = {b}
 Usando la fórmula de Newton-Cotes Cerradas de grado {n}.
 
 La fórmula es:
-∫f(x)dx ≈ α · (b - a) · Σ [cᵢ · f(xᵢ)]
+∫f(x)dx ≈ α · h · Σ [cᵢ · f(xᵢ)]
 donde:
 α = {alpha}
 Coeficientes: {coef_str}
-xᵢ son puntos equiespaciados desde {a} hasta {b}
+h = (b - a)/{constantes["intervalos"]}
+xᵢ = a + i·h son puntos equiespaciados desde {a} hasta {b}
 
 ¿Cuál es el valor aproximado de la integral?
 """
         return problema, resultado
 
-    def generar_problema_newton_cotes_abiertas(self, n, constantes_newton_cotes_abiertas):
+    def generar_problema_newton_cotes_abiertas(self, n):
         """Genera problema para Newton-Cotes Abiertas"""
         funciones = [
             {"func": lambda x: 1 - x**2, "a": 0, "b": 1, "desc": "1 - x²"},
             {"func": lambda x: x**3, "a": 0, "b": 2, "desc": "x³"},
-            {"func": lambda x: math.cos(x), "a": 0, "b": math.pi/2, "desc": "cos(x)"},
-            {"func": lambda x: math.log(1 + x), "a": 0, "b": 1, "desc": "ln(1+x)"}
+            {"func": lambda x: np.cos(x), "a": 0, "b": np.pi/2, "desc": "cos(x)"},
+            {"func": lambda x: np.log(1 + x), "a": 0, "b": 1, "desc": "ln(1+x)"}
         ]
         
         funcion_elegida = random.choice(funciones)
@@ -699,23 +2137,17 @@ xᵢ son puntos equiespaciados desde {a} hasta {b}
         a = funcion_elegida["a"]
         b = funcion_elegida["b"]
         desc = funcion_elegida["desc"]
+        f = self.telemetria.envolver(f, desc, "Newton-Cotes Abiertas")
         
-        # Obtener constantes de la tabla
-        constantes = constantes_newton_cotes_abiertas.get(n)
-        if not constantes:
-            n = 2  # Valor por defecto
-            constantes = constantes_newton_cotes_abiertas[n]
+        # Obtener constantes (exactas y en caché para cualquier n)
+        constantes = self.constantes_newton_cotes(n, abierta=True)
         
         alpha = constantes["alpha"]
         coef = constantes["coef"]
         
         # Calcular respuesta usando Newton-Cotes Abiertas
         # Para fórmulas abiertas, los puntos no incluyen los extremos
-        h = (b - a) / (n + 2)
-        resultado = 0
-        for i in range(1, n + 2):  # i desde 1 hasta n+1
-            resultado += coef[i] * f(a + i * h)
-        resultado *= alpha * (b - a)
+        resultado = self.integrar(f, a, b, "Newton-Cotes Abiertas", n)
         
         # Formatear coeficientes para mostrar
         coef_str = " + ".join([f"{coef[i]}·f(x{i})" for i in range(1, len(coef)-1)])
@@ -730,11 +2162,12 @@ Desde x = {a} hasta x = {b}
 Usando la fórmula de Newton-Cotes Abiertas de grado {n}.
 
 La fórmula es:
-∫f(x)dx ≈ α · (b - a) · Σ [cᵢ · f(xᵢ)]
+∫f(x)dx ≈ α · h · Σ [cᵢ · f(xᵢ)]
 donde:
 α = {alpha}
 Coeficientes: {coef_str}
-xᵢ son puntos equiespaciados entre {a} y {b} (sin incluir extremos)
+h = (b - a)/{constantes["intervalos"]}
+xᵢ = a + i·h son puntos equiespaciados entre {a} y {b} (sin incluir extremos)
 
 ¿Cuál es el valor aproximado de la integral?
 """